@@ -0,0 +1,221 @@
+"""Measures what the page objects themselves cost, against a local replica of the shop.
+
+The replica in benchmarks/site mirrors the markup the page objects rely on (home, books listing,
+computers, cart, registration and checkout), so server latency is close to zero and what is left
+is framework overhead: locator resolution, waits, WebDriver round trips and data extraction.
+
+Usage:
+    python -m benchmarks.bench_pages --browser chrome:fast --iterations 20
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler
+
+from pages.base_page import BasePage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.home_page import HomePage
+from pages.product_list_page import ProductListPage
+from pages.registration_page import RegistrationPage
+from utils.background_server import BackgroundServer
+from utils.browser_profiles import launch_browser, parse_browser_option
+from utils.load_runner import percentile
+from utils.step_timing import start_recording, stop_recording
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "site")
+
+
+class ReplicaHandler(SimpleHTTPRequestHandler):
+    """Serves benchmarks/site, mapping shop paths such as /books to books.html."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def translate_path(self, path):
+        path = path.split("?", 1)[0].split("#", 1)[0]
+        if path != "/" and not os.path.splitext(path)[1]:
+            path += ".html"
+        return super().translate_path(path)
+
+    def log_message(self, format, *args):
+        pass  # Keep the benchmark output readable
+
+
+class ReplicaServer(BackgroundServer):
+    """Runs the replica on a background thread; use as a context manager or start()/stop()."""
+
+    thread_name = "replica-site"
+
+    def __init__(self, host="127.0.0.1", port=0, directory=SITE_DIR):
+        super().__init__(partial(ReplicaHandler, directory=directory), host, port)
+
+
+class Benchmark:
+    """One measured operation; ``setup`` runs before every iteration and is not measured."""
+
+    def __init__(self, name, category, operation, setup=None):
+        self.name = name
+        self.category = category
+        self.operation = operation
+        self.setup = setup
+
+
+def build_benchmarks(driver, base_url):
+    home = HomePage(driver)
+    listing = ProductListPage(driver)
+    cart = CartPage(driver)
+    registration = RegistrationPage(driver)
+    checkout = CheckoutPage(driver)
+
+    def go(path):
+        return lambda: driver.get(base_url + path)
+
+    def extract_grid_per_element():
+        # The pre-bulk approach: one round trip per product and field
+        return [
+            {
+                "productTitle": box.find_element(*listing.product_title).text,
+                "actualPrice": box.find_element(*listing.product_actual_price).text,
+            }
+            for box in driver.find_elements(*listing.product_items)
+        ]
+
+    user = ("Bench", "User", "bench@example.com", "Secret123", "Secret123")
+    billing = ("United States", "Springfield", "742 Evergreen Terrace", "49007", "5550100")
+
+    return [
+        Benchmark("round trip (return 1)", "round trip", lambda: driver.execute_script("return 1")),
+        Benchmark("HomePage.open", "navigation", home.open),
+        Benchmark("find_element header link", "locator", lambda: driver.find_element(*home.cart_quantity), go("")),
+        Benchmark("wait.visible header link", "wait", lambda: home.wait.visible(home.cart_quantity), go("")),
+        Benchmark(
+            "wait.all_visible 3 header links", "wait",
+            lambda: home.wait.all_visible(home.register_user, home.login_user, home.cart_button), go(""),
+        ),
+        Benchmark("books grid, per element", "extraction", extract_grid_per_element, go("books")),
+        Benchmark("books grid, get_product_grid", "extraction", listing.get_product_grid, go("books")),
+        Benchmark("verify_sort_by_price", "page op", listing.verify_sort_by_price, go("books")),
+        Benchmark(
+            "verify_sort_order name Z to A", "page op", lambda: listing.verify_sort_order("Name: Z to A"), go("books"),
+        ),
+        Benchmark("change_number_of_items", "page op", listing.change_number_of_items, go("books")),
+        Benchmark("verify_pagination 4 per page", "page op", listing.verify_pagination, go("books")),
+        Benchmark(
+            "verify_sub_category_titles", "page op",
+            lambda: listing.verify_sub_category_titles(["Desktops", "Notebooks", "Accessories"]), go("computers"),
+        ),
+        Benchmark("CartPage.get_product_details", "page op", cart.get_product_details, cart.open),
+        Benchmark("register_user typed", "form", lambda: registration.register_user(*user), go("register")),
+        Benchmark("register_user fast", "form", lambda: registration.register_user(*user, fast=True), go("register")),
+        Benchmark(
+            "billing address typed", "form",
+            lambda: checkout.fill_billing_address_mandatory_fields(*billing), go("onepagecheckout"),
+        ),
+        Benchmark(
+            "billing address fast", "form",
+            lambda: checkout.fill_billing_address_mandatory_fields(*billing, fast=True), go("onepagecheckout"),
+        ),
+        Benchmark(
+            "checkout confirm_billing_address", "page op", checkout.confirm_billing_address, go("onepagecheckout"),
+        ),
+    ]
+
+
+def run_benchmark(benchmark, recorder, iterations, warmup=1):
+    samples = []
+    for iteration in range(warmup + iterations):
+        if benchmark.setup:
+            benchmark.setup()
+        commands, wait_seconds, navigation_seconds = recorder.commands, recorder.wait_seconds, recorder.navigation_seconds
+        start = time.perf_counter()
+        benchmark.operation()
+        seconds = time.perf_counter() - start
+        if iteration >= warmup:
+            samples.append((
+                seconds,
+                recorder.commands - commands,
+                recorder.wait_seconds - wait_seconds,
+                recorder.navigation_seconds - navigation_seconds,
+            ))
+
+    durations = sorted(sample[0] for sample in samples)
+    return {
+        "name": benchmark.name,
+        "category": benchmark.category,
+        "iterations": iterations,
+        "meanMs": statistics.mean(durations) * 1000,
+        "p50Ms": percentile(durations, 0.50) * 1000,
+        "p95Ms": percentile(durations, 0.95) * 1000,
+        "commands": statistics.mean(sample[1] for sample in samples),
+        "waitMs": statistics.mean(sample[2] for sample in samples) * 1000,
+        "navigationMs": statistics.mean(sample[3] for sample in samples) * 1000,
+    }
+
+
+def estimate_round_trips(results):
+    """Splits every operation's time into WebDriver round trips and everything else."""
+    round_trip_ms = next(result["p50Ms"] for result in results if result["category"] == "round trip")
+    for result in results:
+        # Navigation time is spent by the browser loading the page, not by round trips
+        commands = result["commands"] - (1 if result["navigationMs"] else 0)
+        result["roundTripMs"] = commands * round_trip_ms
+        result["otherMs"] = max(0.0, result["meanMs"] - result["navigationMs"] - result["roundTripMs"])
+    return results
+
+
+def format_report(results):
+    lines = [
+        f"{'operation':36} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'cmds':>6} "
+        f"{'rtt ms':>8} {'wait ms':>8} {'nav ms':>8}"
+    ]
+    for row in results:
+        lines.append(
+            f"{row['name']:36} {row['meanMs']:>8.1f} {row['p50Ms']:>8.1f} {row['p95Ms']:>8.1f} "
+            f"{row['commands']:>6.1f} {row['roundTripMs']:>8.1f} {row['waitMs']:>8.1f} {row['navigationMs']:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the page objects against a local shop replica.")
+    parser.add_argument("--browser", default="chrome:fast", help="browser[:profile], as for pytest --browser")
+    parser.add_argument("--iterations", type=int, default=10, help="Measured runs per operation")
+    parser.add_argument("--only", help="Comma separated substrings; run only operations whose name matches one")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    browser_name, profile = parse_browser_option(args.browser)
+    filters = [value.strip() for value in (args.only or "").split(",") if value.strip()]
+
+    with ReplicaServer() as server:
+        # Every page object builds its URLs from the class-level base URL
+        BasePage.base_url = server.base_url
+        driver = launch_browser(browser_name, profile)
+        # The active recorder also receives the wait engine's timings
+        recorder = start_recording(driver)
+        try:
+            results = [
+                run_benchmark(benchmark, recorder, args.iterations)
+                for benchmark in build_benchmarks(driver, server.base_url)
+                if benchmark.category == "round trip" or not filters
+                or any(value in benchmark.name for value in filters)
+            ]
+        finally:
+            stop_recording()
+            driver.quit()
+
+    results = estimate_round_trips(results)
+    print(format_report(results))
+    if args.json_path:
+        with open(args.json_path, "w") as file:
+            json.dump({"browser": args.browser, "results": results}, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,170 @@
 import pytest
-from selenium import webdriver
 from pages.home_page import HomePage
+from utils.api_client import BASE_URL, PetStoreClient
+from utils.async_api_client import AsyncPetStoreClient
+from utils.auth_cache import AuthSessionCache
+from utils.browser_profiles import PROFILES, launch_browser, parse_browser_option
+from utils.cleanup import CleanupService
+from utils.data_factory import DataFactory, EntityRegistry, current_run_id
+from utils.driver_pool import DriverPool
+from utils.elements import element_cache, summarize_cache_session
+from utils.har import summarize_har_session
+from utils.network import NetworkOptimizer, parse_resource_classes, summarize_session
+from utils.petstore_stub import PetStoreStub
+from utils.state_seeder import StateSeeder
+from utils.step_timing import start_recording, stop_recording
+from utils import web_vitals
+
+pytest_plugins = [
+    "utils.parallel", "utils.async_mode", "utils.timing_report", "utils.perf_history", "utils.scheduler",
+    "utils.chains",
+]
+
+driver_pool_key = pytest.StashKey[DriverPool]()
+cleanup_key = pytest.StashKey[CleanupService]()
 
 def pytest_addoption(parser):
     """Add a command-line option for selecting the browser."""
     parser.addoption(
-        "--browser", action="store", default="chrome", help="Browser to run tests: chrome or firefox"
+        "--browser", action="store", default="chrome",
+        help=f"Browser to run tests: chrome or firefox, optionally with a profile "
+             f"({', '.join(PROFILES)}), e.g. chrome:fast"
+    )
+    parser.addoption(
+        "--user-data-template", action="store", default=None,
+        help="Chrome profile directory copied for every browser started with the 'ci' profile"
+    )
+    parser.addoption(
+        "--pool-size", action="store", type=int, default=1,
+        help="Number of browsers kept open per worker for the whole session"
+    )
+    parser.addoption(
+        "--block-resources", action="store", default="",
+        help="Chrome only: comma separated resource classes to block (images, fonts, media, third-party)"
+    )
+    parser.addoption(
+        "--asset-cache-dir", action="store", default=None,
+        help="Chrome only: directory that keeps the browsers' asset caches (one subdirectory per browser) across tests "
+             "and sessions"
+    )
+    parser.addoption(
+        "--har", action="store", default=None, metavar="DIR",
+        help="Chrome only: record every request of each UI test as DIR/<test>.har.gz and list the slowest "
+             "and largest requests per page"
+    )
+    parser.addoption(
+        "--api-pool-size", action="store", type=int, default=10,
+        help="Number of keep-alive connections the Pet Store API client keeps open"
+    )
+    parser.addoption(
+        "--api-retries", action="store", type=int, default=3,
+        help="Number of retries for failed Pet Store API connections"
+    )
+    parser.addoption(
+        "--api-target", action="store", default="remote", choices=("remote", "local"),
+        help="Run API tests against the public Pet Store (remote) or the bundled in-memory stand-in (local)"
+    )
+    parser.addoption(
+        "--data-registry", action="store", default=None, metavar="PATH",
+        help="JSONL file that every user and pet created through the API client is recorded in, for bulk cleanup"
+    )
+    parser.addoption(
+        "--web-vitals", action="store_true", default=False,
+        help="Capture TTFB, DOMContentLoaded, load, LCP and CLS after page-object navigations and fail tests "
+             "that exceed the performanceBudgets in test_data.json"
     )
+    parser.addoption(
+        "--crawl", action="store", type=int, default=0, metavar="WORKERS",
+        help="Crawl and validate every category and product page over HTTP with WORKERS concurrent requests; "
+             "0 skips the catalog crawl"
+    )
+    parser.addoption(
+        "--cleanup-workers", action="store", type=int, default=8,
+        help="Number of concurrent deletes used to remove the users and pets a session created; 0 keeps them"
+    )
+
+def pytest_report_header(config):
+    """Record the browser and profile the run used."""
+    browser_name, profile = parse_browser_option(config.getoption("--browser"))
+    return f"browser: {browser_name}, profile: {profile.name} ({profile.description})"
+
+def pytest_configure(config):
+    """Fix the run id before any worker starts, so generated test data is unique per run, not per process."""
+    current_run_id()
+
+@pytest.fixture(scope="session")
+def network_optimizer(request):
+    """Resource blocking, asset caching and HAR recording for Chrome, or None when not requested."""
+    block = parse_resource_classes(request.config.getoption("--block-resources"))
+    cache_dir = request.config.getoption("--asset-cache-dir")
+    har_dir = request.config.getoption("--har")
+    browser_name, _ = parse_browser_option(request.config.getoption("--browser"))
+    if browser_name != "chrome" or not (block or cache_dir or har_dir):
+        return None
+    return NetworkOptimizer(block=block, cache_dir=cache_dir, har_dir=har_dir)
+
+@pytest.fixture(scope="session")
+def driver_pool(request, network_optimizer):
+    """Session-wide pool of browsers, launched on first use and quit at the end of the run."""
+    browser_name, profile = parse_browser_option(request.config.getoption("--browser"))
+    user_data_template = request.config.getoption("--user-data-template")
+    pool = DriverPool(
+        lambda: launch_browser(browser_name, profile, network_optimizer, user_data_template),
+        size=request.config.getoption("--pool-size")
+    )
+    request.config.stash[driver_pool_key] = pool
+    yield pool
+    pool.close()
+
+@pytest.fixture
+def browser(request, driver_pool, network_optimizer):
+    """Borrow a clean browser from the pool for a single test."""
+    driver = driver_pool.acquire()
+    timing = request.config.getoption("--timing-report")
+    vitals = request.config.getoption("--web-vitals")
+    try:
+        elements = element_cache(driver)
+        elements.reset()
+        if network_optimizer:
+            network_optimizer.start_test(driver)
+        if timing:
+            start_recording(driver)
+        if vitals:
+            web_vitals.start_collecting(web_vitals.load_budgets())
+        yield driver
+        # Per-test measurements end up in the test report (and JUnit XML properties)
+        request.node.user_properties.append(("elementCache", elements.stats()))
+        if timing:
+            request.node.user_properties.append(("timing", stop_recording()))
+        if vitals:
+            request.node.user_properties.append(("webVitals", web_vitals.stop_collecting().measurements))
+        if network_optimizer:
+            request.node.user_properties.extend(network_optimizer.finish_test(driver, request.node.nodeid))
+    finally:
+        # A browser that died during the test must still give its pool slot back (release discards it)
+        if timing:
+            stop_recording()
+        if vitals:
+            web_vitals.stop_collecting()
+        driver_pool.release(driver)
+
+@pytest.fixture(scope="session")
+def auth_cache():
+    """Per-worker cache of logged-in session cookies, keyed by user email."""
+    return AuthSessionCache()
+
+@pytest.fixture
+def login_as(browser, auth_cache):
+    """Log the browser in as the given loginData user without going through the form when possible."""
+    def login(login_data):
+        auth_cache.login(browser, login_data["email"], login_data["password"])
+        return browser
+    return login
 
 @pytest.fixture
-def browser(request):
-    """Initialize the selected browser."""
-    browser_name = request.config.getoption("--browser")
-    if browser_name == "chrome":
-        driver = webdriver.Chrome()  # Ensure chromedriver is in PATH
-    elif browser_name == "firefox":
-        driver = webdriver.Firefox()  # Ensure geckodriver is in PATH
-    else:
-        raise ValueError(f"Unsupported browser: {browser_name}")
-    driver.maximize_window()
-    yield driver
-    driver.quit()
+def state_seeder(browser):
+    """Seed cart and wishlist state over HTTP on the browser's own session."""
+    return StateSeeder(browser)
 
 @pytest.fixture
 def home_page(browser):
@@ -29,3 +173,81 @@ def home_page(browser):
     browser.get(base_url)  # Step 1: Open the website
     home_page = HomePage(browser)  # Step 2: Create HomePage object
     return home_page  # Return the HomePage object
+
+@pytest.fixture(scope="session")
+def petstore_base_url(request):
+    """Base URL of the Pet Store under test, starting the local stand-in when --api-target=local."""
+    if request.config.getoption("--api-target") == "remote":
+        yield BASE_URL
+        return
+    with PetStoreStub() as stub:
+        yield stub.base_url
+
+@pytest.fixture(scope="session")
+def data_factory(request):
+    """Expands test_data.json templates with ids, usernames and emails unique to this run and worker."""
+    from utils.parallel import get_worker_id  # Plugin module: imported late so pytest registers it first
+    registry = EntityRegistry(request.config.getoption("--data-registry"))
+    return DataFactory.from_file("test_data.json", worker_id=get_worker_id(), registry=registry)
+
+@pytest.fixture(scope="session")
+def api_client(request, petstore_base_url, data_factory):
+    """Pet Store API client shared by the whole session so connections are reused."""
+    client = PetStoreClient(
+        base_url=petstore_base_url,
+        pool_size=request.config.getoption("--api-pool-size"),
+        retries=request.config.getoption("--api-retries"),
+        registry=data_factory.registry,
+    )
+    yield client
+
+    # Delete whatever the session created and did not delete itself, through the same pooled connections
+    workers = request.config.getoption("--cleanup-workers")
+    if workers > 0:
+        from utils.parallel import send_to_main  # Plugin module: imported late so pytest registers it first
+        cleanup = CleanupService(client, data_factory.registry, workers).run()
+        # A worker's stash never reaches the main process, which prints the summary
+        if not send_to_main("cleanup", cleanup.as_dict()):
+            request.config.stash[cleanup_key] = cleanup
+    client.close()
+
+@pytest.fixture(scope="session")
+def async_api_client(api_client, request):
+    """Awaitable Pet Store client sharing the connection pool of api_client."""
+    client = AsyncPetStoreClient(api_client, concurrency=request.config.getoption("--api-pool-size"))
+    yield client
+    client.close()
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Fail a test that passed its checks but loaded a page over its performance budget."""
+    result = yield
+    violations = web_vitals.violations()
+    if violations:
+        pytest.fail("Page performance budget exceeded:\n" + "\n".join(violations), pytrace=False)
+    return result
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report what the browser pool, element cache and network optimizations saved, and what was cleaned up."""
+    pool = config.stash.get(driver_pool_key, None)
+    if pool is not None and pool.checkouts:
+        terminalreporter.write_line(pool.summary())
+    reports = [report for reports in terminalreporter.stats.values() for report in reports]
+    cache_summary = summarize_cache_session(reports)
+    if cache_summary:
+        terminalreporter.write_line(cache_summary)
+    network_summary = summarize_session(reports)
+    if network_summary:
+        terminalreporter.write_line(network_summary)
+    har_summary = summarize_har_session(reports)
+    if har_summary:
+        terminalreporter.section("slowest and largest requests per page")
+        for line in har_summary:
+            terminalreporter.write_line(line)
+    from utils.parallel import worker_results
+    cleanup = config.stash.get(cleanup_key, None)
+    worker_cleanups = worker_results(config, "cleanup")
+    if worker_cleanups:
+        cleanup = CleanupService.combine(worker_cleanups)
+    if cleanup is not None:
+        terminalreporter.write_line(cleanup.summary())
@@ -0,0 +1,84 @@
+import inspect
+
+from utils import web_vitals
+from utils.elements import ElementHandle, element_cache
+from utils.step_timing import timed_step
+from utils.waits import Waiter
+
+
+class BasePage:
+    base_url = "https://demowebshop.tricentis.com/"
+
+    # JavaScript that fills every field of arguments[0] once all of them are visible, in one round trip.
+    # Values go through the native setter so frameworks watching the input see the change.
+    _fill_form_script = """
+        function find(by, selector) {
+            if (by === 'id') return document.getElementById(selector);
+            if (by === 'name') return document.getElementsByName(selector)[0] || null;
+            if (by === 'css selector') return document.querySelector(selector);
+            if (by === 'xpath') {
+                return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+                    .singleNodeValue;
+            }
+            throw new Error('Unsupported locator strategy for form fill: ' + by);
+        }
+        function visible(element) {
+            return !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length);
+        }
+
+        var fields = arguments[0].map(function (field) {
+            return {element: find(field[0], field[1]), value: field[2]};
+        });
+        if (!fields.every(function (field) { return field.element && visible(field.element); })) {
+            return false;
+        }
+        fields.forEach(function (field) {
+            var element = field.element;
+            var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value').set;
+            element.focus();
+            setter.call(element, field.value);
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+            element.blur();
+        });
+        return true;
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """Time every public method of a page object as a step (a no-op unless --timing-report is set)."""
+        super().__init_subclass__(**kwargs)
+        for name, member in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(member):
+                setattr(cls, name, timed_step(member, f"{cls.__name__}.{name}"))
+
+    def __init__(self, driver, timeout=10):
+        self.driver = driver
+
+        # Shared wait engine with adaptive polling
+        self.wait = Waiter(driver, timeout)
+
+        # Elements resolved on the current page, shared by all page objects on this browser
+        self.elements = element_cache(driver)
+
+    # Lazy, cached handle to the element a locator points at
+    def element(self, locator):
+        return ElementHandle(self.elements, locator, self.wait)
+
+    # Fill several inputs with a single script call
+    @timed_step
+    def fill_form(self, values, timeout=None):
+        """Sets every locator in ``values`` to its value at once, firing input and change events.
+
+        Faster than typing, but no key events are sent; use send_keys where real typing matters.
+        """
+        fields = [[by, selector, str(value)] for (by, selector), value in values.items()]
+        self.wait.until(
+            lambda driver: driver.execute_script(self._fill_form_script, fields),
+            timeout,
+            description=f"fill form {list(values)}"
+        )
+
+    # Start a new page state after a navigation and record its page-load metrics (a no-op unless --web-vitals is set)
+    def _capture_page_metrics(self, page, url_contains=None):
+        self.elements.invalidate()
+        return web_vitals.capture(self.driver, page, self.wait, url_contains)
@@ -1,10 +1,9 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import BasePage
 
-class CartPage:
+class CartPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
 
         # Locators
         self.product_name = (By.CSS_SELECTOR, '.product-name')
@@ -16,45 +15,37 @@ class CartPage:
         self.terms_checkbox = (By.CSS_SELECTOR, '#termsofservice[type="checkbox"]')
         self.checkout_button = (By.XPATH, "//button[text()='Checkout']")
 
+    # Method to open the cart page directly
+    def open(self):
+        self.driver.get(f"{self.base_url}cart")
+        self._capture_page_metrics("cart")
+
     # Method to retrieve product details from the cart
     def get_product_details(self):
-        product_title = WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.product_name)
-        ).text
-        product_price = WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.product_price)
-        ).text
-        product_qty = WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.product_qty)
-        ).get_attribute("value")
+        product_title, product_price, product_qty = self.wait.all_visible(
+            self.product_name, self.product_price, self.product_qty
+        )
 
         # Return the details as a dictionary
         return {
-            "productTitle": product_title.strip(),
-            "productPrice": product_price.strip(),
-            "productQty": int(product_qty)
+            "productTitle": product_title.text.strip(),
+            "productPrice": product_price.text.strip(),
+            "productQty": int(product_qty.get_attribute("value"))
         }
 
     # Method to remove a product from the cart
     def remove_product_from_cart(self):
-        remove_checkbox = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.remove_from_cart_checkbox)
-        )
+        remove_checkbox = self.wait.clickable(self.remove_from_cart_checkbox)
         remove_checkbox.click()
 
-        update_button = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.update_cart_btn)
-        )
+        update_button = self.wait.clickable(self.update_cart_btn)
         update_button.click()
 
     # Method to navigate to the checkout
     def navigate_to_checkout(self):
-        terms_checkbox = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.terms_checkbox)
-        )
+        terms_checkbox = self.wait.clickable(self.terms_checkbox)
         terms_checkbox.click()
 
-        checkout_button = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.checkout_button)
-        )
-        self.checkout_button.click()
+        checkout_button = self.wait.clickable(self.checkout_button)
+        checkout_button.click()
+        self._capture_page_metrics("checkout", url_contains="checkout")
@@ -1,12 +1,11 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support.select import Select
-from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import BasePage
 
 
-class CheckoutPage:
+class CheckoutPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
 
         # Locators
         self.country_dropdown = (By.ID, 'BillingNewAddress_CountryId')
@@ -22,18 +21,24 @@ class CheckoutPage:
         self.order_successfully_processed_message = (By.XPATH, "//*[contains(text(), 'Your order has been')]")
 
     # Method to fill billing address mandatory fields
-    def fill_billing_address_mandatory_fields(self, country, city, address1, zipcode, phone):
+    # Pass fast=True to set the text fields in one script call instead of typing them
+    def fill_billing_address_mandatory_fields(self, country, city, address1, zipcode, phone, fast=False):
         # Select the country from the dropdown
-        country_dropdown_element = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.country_dropdown)
-        )
+        country_dropdown_element = self.wait.clickable(self.country_dropdown)
         Select(country_dropdown_element).select_by_visible_text(country)
 
-        # Fill other fields
-        WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.city_field)).send_keys(city)
-        WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.address1_field)).send_keys(address1)
-        WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.zipcode_field)).send_keys(zipcode)
-        WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.phone_field)).send_keys(phone)
+        # Fill other fields once they are all visible
+        values = {
+            self.city_field: city,
+            self.address1_field: address1,
+            self.zipcode_field: zipcode,
+            self.phone_field: phone
+        }
+        if fast:
+            self.fill_form(values)
+        else:
+            for field, value in zip(self.wait.all_visible(*values), values.values()):
+                field.send_keys(value)
 
     # Method to confirm billing address
     def confirm_billing_address(self):
@@ -45,37 +50,26 @@ class CheckoutPage:
 
     # Method to confirm shipping method
     def confirm_shipping_method(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.shipping_method_continue_button)
-        ).click()
+        self.wait.clickable(self.shipping_method_continue_button).click()
 
     # Method to confirm payment method
     def confirm_payment_method(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.payment_method_continue_button)
-        ).click()
+        self.wait.clickable(self.payment_method_continue_button).click()
 
     # Method to confirm payment information
     def confirm_payment_information(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.payment_information_continue_button)
-        ).click()
+        self.wait.clickable(self.payment_information_continue_button).click()
 
     # Method to confirm the order
     def confirm_order(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.order_confirmation_continue_button)
-        ).click()
+        self.wait.clickable(self.order_confirmation_continue_button).click()
+        self._capture_page_metrics("orderCompleted", url_contains="completed")
 
     # Method to get the order confirmation message
     def get_order_confirmation_message(self):
-        return WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.order_successfully_processed_message)
-        ).text
+        return self.wait.visible(self.order_successfully_processed_message).text
 
     # Private helper method to click a "Continue" button
     def _click_continue_button(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.checkout_continue_button)
-        ).click()
-        WebDriverWait(self.driver, 10).until(EC.invisibility_of_element_located(self.checkout_continue_button))
+        self.wait.clickable(self.checkout_continue_button).click()
+        self.wait.invisible(self.checkout_continue_button)
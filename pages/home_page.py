@@ -1,11 +1,10 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import BasePage
 
 
-class HomePage:
+class HomePage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
 
         # Locators
         self.register_user = (By.CSS_SELECTOR, '.ico-register')
@@ -22,28 +21,28 @@ class HomePage:
     # Open the home page
     def open(self):
         """Navigates to the Demo Web Shop homepage."""
-        base_url = "https://demowebshop.tricentis.com/"
-        self.driver.get(base_url)
+        self.driver.get(self.base_url)
+        self._capture_page_metrics("home")
+
+    # Open the Books category from the top menu
+    def open_books(self):
+        """Clicks the Books group in the top navigation."""
+        self.wait.clickable(self.books_group).click()
+        self._capture_page_metrics("books", url_contains="/books")
 
     # Get the account email of the logged-in user
     def get_account_email(self):
         """Returns the email of the logged-in user."""
-        account_email_element = WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.logged_in_account)
-        )
+        account_email_element = self.wait.visible(self.logged_in_account)
         return account_email_element.text
 
     # Verify the subcategories under the Computers group
     def verify_computers_subcategories(self, expected_subcategories):
         """Verifies that the Computers subcategories match the expected list."""
-        computers_group = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.computers_group)
-        )
+        computers_group = self.wait.clickable(self.computers_group)
         computers_group.click()
 
-        subcategories = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, '.sub-category-item a'))
-        )
+        subcategories = self.wait.all_present((By.CSS_SELECTOR, '.sub-category-item a'))
         actual_subcategories = [subcategory.text for subcategory in subcategories]
 
         assert actual_subcategories == expected_subcategories, \
@@ -52,7 +51,5 @@ class HomePage:
     # Add an item to the wishlist
     def add_item_to_wishlist(self):
         """Clicks the wishlist button to add an item to the wishlist."""
-        wishlist_button = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.wishlist_button)
-        )
+        wishlist_button = self.wait.clickable(self.wishlist_button)
         wishlist_button.click()
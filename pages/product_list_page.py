@@ -1,13 +1,11 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support.select import Select
-from selenium.webdriver.support import expected_conditions as EC
-import time
+from pages.base_page import BasePage
+from utils.list_verifier import ListVerifier
 
 
-class ProductListPage:
+class ProductListPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
 
         # Locators
         self.sub_category_grid = (By.CSS_SELECTOR, '.sub-category-grid')
@@ -22,132 +20,141 @@ class ProductListPage:
         self.add_to_cart = (By.CSS_SELECTOR, '.button-2.product-box-add-to-cart-button')
         self.add_to_wishlist_btn = (By.CSS_SELECTOR, '.add-to-wishlist-button')
         self.fiction_ex_book = (By.CSS_SELECTOR, 'a[href="/fiction-ex"]')
+        self.wishlist_quantity = (By.CSS_SELECTOR, '.ico-wishlist .wishlist-qty')
+
+        # Grid snapshots and sort/page-size/pagination checks
+        self.list_verifier = ListVerifier(
+            driver, self.wait,
+            grid_selector=self.product_grid[1], item_selector=self.product_items[1],
+            sort_selector='#products-orderby', page_size_selector='#products-pagesize'
+        )
+
+    # JavaScript that reads every product box matching arguments[0] in a single round trip
+    _extract_products_script = """
+        return Array.from(document.querySelectorAll(arguments[0])).map(function (box, index) {
+            var item = box.matches('.product-item') ? box : box.querySelector('.product-item');
+            var title = box.querySelector('.product-title a');
+            var price = box.querySelector('.actual-price');
+            var addToCart = box.querySelector('.button-2.product-box-add-to-cart-button');
+            return {
+                index: index,
+                productId: item ? item.getAttribute('data-productid') : null,
+                productTitle: title ? title.innerText.trim() : null,
+                actualPrice: price ? price.innerText.trim() : null,
+                hasAddToCart: addToCart !== null,
+                addToCartButton: addToCart
+            };
+        });
+    """
+
+    # JavaScript that reads the subcategory titles in a single round trip
+    _extract_sub_category_titles_script = """
+        return Array.from(document.querySelectorAll(arguments[0])).map(function (item) {
+            var title = item.querySelector('.title a');
+            return title ? title.innerText.trim() : null;
+        });
+    """
+
+    # Extract structured data for all products matching a CSS locator
+    def extract_products(self, locator=None):
+        """Returns id, title, price and add-to-cart presence for every product box in one script call."""
+        by, selector = locator or self.product_items
+        assert by == By.CSS_SELECTOR, f"Bulk extraction needs a CSS locator, got {by}"
+        return self.driver.execute_script(self._extract_products_script, selector)
+
+    # Extract the product grid once it is present
+    def get_product_grid(self):
+        self.wait.all_present(self.product_items)
+        return self.extract_products(self.product_items)
+
+    @staticmethod
+    def _product_details(product):
+        """Public product details, without the element handle used internally."""
+        return {
+            "productId": product["productId"],
+            "productTitle": product["productTitle"],
+            "actualPrice": product["actualPrice"]
+        }
 
     # Verify subcategory titles
     def verify_sub_category_titles(self, expected_titles):
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.sub_category_grid)
-        )
+        self.wait.visible(self.sub_category_grid)
 
-        # Verify there are exactly 3 items
-        sub_category_items = self.driver.find_elements(*self.sub_category_items)
-        assert len(sub_category_items) == 3, f"Expected 3 subcategories, but found {len(sub_category_items)}"
+        # Collect all titles in one call and verify there are exactly 3 items
+        actual_titles = self.driver.execute_script(
+            self._extract_sub_category_titles_script, self.sub_category_items[1]
+        )
+        assert len(actual_titles) == 3, f"Expected 3 subcategories, but found {len(actual_titles)}"
 
-        # Collect titles and verify they match the expected titles
-        actual_titles = [
-            item.find_element(By.CSS_SELECTOR, '.title a').text.strip()
-            for item in sub_category_items
-        ]
+        # Verify they match the expected titles
         assert actual_titles == expected_titles, f"Expected titles {expected_titles}, but got {actual_titles}"
 
     # Verify sort by price (low to high)
     def verify_sort_by_price(self):
-        dropdown = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.sort_by_dropdown)
-        )
-        Select(dropdown).select_by_visible_text('Price: Low to High')
-
-        # Wait for the sorting to complete
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_all_elements_located(self.product_items)
-        )
-
-        # Collect all the actual prices
-        product_items = self.driver.find_elements(*self.product_items)
-        prices = [
-            float(item.find_element(By.CSS_SELECTOR, '.actual-price').text.replace('$', '').strip())
-            for item in product_items
-        ]
-
-        # Verify prices are sorted in ascending order
-        assert prices == sorted(prices), f"Prices are not sorted correctly: {prices}"
+        self.verify_sort_order('Price: Low to High')
+
+    # Sort the grid and verify the order on a single snapshot of the re-sorted grid
+    def verify_sort_order(self, order):
+        """Selects ``order`` in the sort dropdown and verifies the products follow it, without losing any."""
+        before = self.list_verifier.snapshot()
+        after = self.list_verifier.select_sort(order)
+        self.list_verifier.check_complete(after)
+        assert after.sort_by == order, f"Expected '{order}' to be selected, but got '{after.sort_by}'"
+        assert len(after.records) == len(before.records), \
+            f"Sorting changed the number of products from {len(before.records)} to {len(after.records)}"
+        self.list_verifier.check_sorted(after, order)
 
     # Change the number of items displayed
     def change_number_of_items(self):
-        initial_item_count = len(self.driver.find_elements(*self.product_items))
-        dropdown = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.product_list_number)
-        )
-        Select(dropdown).select_by_visible_text('4')
-
-        # Wait for the product grid to update
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_all_elements_located(self.product_items)
-        )
+        initial_item_count = len(self.list_verifier.snapshot().records)
 
-        current_item_count = len(self.driver.find_elements(*self.product_items))
+        # Snapshot the grid once it has been re-rendered
+        snapshot = self.list_verifier.select_page_size('4')
+        current_item_count = len(snapshot.records)
         assert initial_item_count != current_item_count, "Item count did not change"
         assert current_item_count == 4, f"Expected 4 items, but got {current_item_count}"
 
+    # Walk every page of the listing at the given page size
+    def verify_pagination(self, page_size='4'):
+        """Verifies every page is full except the last, pages follow each other and no product repeats."""
+        first = self.list_verifier.select_page_size(page_size)
+        pages = self.list_verifier.walk_pages(first)
+        self.list_verifier.check_pagination(pages, int(page_size))
+        return pages
+
     # Add the first product to the cart
     def add_product_to_cart(self):
-        first_product = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_all_elements_located(self.product_items)
-        )[0]
-
-        # Extract product details
-        product_id = first_product.find_element(*self.product_item).get_attribute('data-productid')
-        product_title = first_product.find_element(*self.product_title).text.strip()
-        actual_price = first_product.find_element(*self.product_actual_price).text.strip()
+        first_product = self.get_product_grid()[0]
+        assert first_product["hasAddToCart"], f"Product '{first_product['productTitle']}' cannot be added to the cart"
 
         # Click "Add to cart"
-        first_product.find_element(*self.add_to_cart).click()
+        first_product["addToCartButton"].click()
 
-
-        return {
-            "productId": product_id,
-            "productTitle": product_title,
-            "actualPrice": actual_price
-        }
+        return self._product_details(first_product)
 
     # Add a specific product to the wishlist
     def add_product_to_wishlist(self):
         """Adds a specific product to the wishlist and returns product details."""
-        # Re-find the fiction_ex_book element to ensure it is fresh
-        fiction_ex_book = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.fiction_ex_book)
-        )
-        fiction_ex_book.click()
-
-        # Locate the "Add to Wishlist" button
-        wishlist_button = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.add_to_wishlist_btn)
-        )
+        self.element(self.fiction_ex_book).clickable().click()
 
-        # Scroll the button into view
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", wishlist_button)
-
-        # Try clicking the button using JavaScript
-        self.driver.execute_script("arguments[0].click();", wishlist_button)
-        print("Debug: Wishlist button clicked using JavaScript.")
+        # Scroll the "Add to Wishlist" button into view and click it in one script call
+        wishlist_button = self.element(self.add_to_wishlist_btn).clickable()
+        wishlist_button.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();")
 
         # Wait for the wishlist count to update
-        WebDriverWait(self.driver, 10).until(
-            lambda driver: int(''.join(
-                filter(str.isdigit, driver.find_element(By.CSS_SELECTOR, '.ico-wishlist .wishlist-qty').text))) > 0
-        )
-
-        # Re-query the product box to avoid stale element reference
-        product_box = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located(self.product_item)
+        wishlist_quantity = self.element(self.wishlist_quantity)
+        self.wait.until(
+            lambda driver: int(''.join(filter(str.isdigit, wishlist_quantity.text)) or 0) > 0,
+            description=f"wishlist count above 0 {self.wishlist_quantity}"
         )
 
-        # Extract product details
-        product_id = product_box.get_attribute('data-productid')
-        product_title = product_box.find_element(*self.product_title).text.strip()
-        actual_price = product_box.find_element(*self.product_actual_price).text.strip()
-
-        return {
-            "productId": product_id,
-            "productTitle": product_title,
-            "actualPrice": actual_price
-        }
+        # Wait for the product box and extract its details in one call
+        self.wait.present(self.product_item)
+        return self._product_details(self.extract_products(self.product_item)[0])
 
     # Validate a book is in the wishlist
     def validate_book_in_wishlist(self, expected_book_title):
-        book_title_element = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'td.product a'))
-        )
+        book_title_element = self.wait.present((By.CSS_SELECTOR, 'td.product a'))
         actual_book_title = book_title_element.text.strip()
         assert actual_book_title == expected_book_title, \
             f"Expected book title '{expected_book_title}', but got '{actual_book_title}'"
@@ -1,11 +1,10 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import BasePage
 
 
-class RegistrationPage:
+class RegistrationPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
 
         # Locators
         self.gender_male = (By.ID, 'gender-male')
@@ -20,52 +19,38 @@ class RegistrationPage:
         self.login_button = (By.CSS_SELECTOR, '.login-button')
 
     # Register a new user
-    def register_user(self, first_name, last_name, email, password, confirm_password):
-        """Registers a new user with the provided details."""
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.first_name_field)
-        ).send_keys(first_name)
-
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.last_name_field)
-        ).send_keys(last_name)
-
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.email_field)
-        ).send_keys(email)
-
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.password_field)
-        ).send_keys(password)
-
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.confirm_password_field)
-        ).send_keys(confirm_password)
+    def register_user(self, first_name, last_name, email, password, confirm_password, fast=False):
+        """Registers a new user with the provided details; ``fast`` fills the form in one script call."""
+        values = {
+            self.first_name_field: first_name,
+            self.last_name_field: last_name,
+            self.email_field: email,
+            self.password_field: password,
+            self.confirm_password_field: confirm_password
+        }
+        if fast:
+            self.fill_form(values)
+        else:
+            for field, value in zip(self.wait.all_visible(*values), values.values()):
+                field.send_keys(value)
 
         # Click the register button
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.register_button)
-        ).click()
+        self.wait.clickable(self.register_button).click()
 
     # Log in as a user
-    def login_user(self, email, password):
-        """Logs in a user with the provided email and password."""
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.email_field)
-        ).send_keys(email)
-
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.password_field)
-        ).send_keys(password)
+    def login_user(self, email, password, fast=False):
+        """Logs in a user with the provided email and password; ``fast`` fills the form in one script call."""
+        if fast:
+            self.fill_form({self.email_field: email, self.password_field: password})
+        else:
+            email_field, password_field = self.wait.all_visible(self.email_field, self.password_field)
+            email_field.send_keys(email)
+            password_field.send_keys(password)
 
         # Click the login button
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.login_button)
-        ).click()
+        self.wait.clickable(self.login_button).click()
 
     # Get the registration message
     def get_registration_message(self):
         """Returns the registration success or error message."""
-        return WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(self.registration_message)
-        ).text
+        return self.wait.visible(self.registration_message).text
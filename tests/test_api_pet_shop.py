@@ -1,31 +1,28 @@
 import pytest
-import requests
 import json
 
-BASE_URL = "https://petstore.swagger.io/v2"
-
 # Load test data from JSON file
 with open("test_data.json", "r") as file:
     test_data = json.load(file)
 
-@pytest.mark.serial
-def test_verify_user_creation():
+@pytest.mark.chain("user")
+def test_verify_user_creation(api_client, data_factory):
     """
     Verify that the API allows creating a user and fetching user details.
     """
-    # Extract user data from JSON
-    user_creation_data = test_data["petStore"]["userCreationData"]
+    # Extract user data from JSON, made unique for this run
+    user_creation_data = data_factory.shared("petStore.userCreationData")
     username = user_creation_data["username"]
 
     # Step 1: Create a user using POST request
-    create_response = requests.post(f"{BASE_URL}/user", json=user_creation_data)
+    create_response = api_client.create_user(user_creation_data)
 
     # Validate the response status
     assert create_response.ok, f"Expected status 200, but got {create_response.status_code}"
     assert create_response.status_code == 200, f"Failed to create user. Response: {create_response.text}"
 
     # Step 2: Fetch the created user details using GET request
-    get_user_response = requests.get(f"{BASE_URL}/user/{username}")
+    get_user_response = api_client.get_user(username)
     assert get_user_response.ok, f"Failed to fetch user. Status: {get_user_response.status_code}"
     assert get_user_response.status_code == 200, f"Expected 200, but got {get_user_response.status_code}"
 
@@ -42,20 +39,18 @@ def test_verify_user_creation():
 
     print("User created and validated successfully.")
 
-def test_verify_user_login():
+@pytest.mark.chain("user")
+def test_verify_user_login(api_client, data_factory):
     """
     Verify that the API allows login as a User.
     """
-    # Extract user data from JSON
-    user_creation_data = test_data["petStore"]["userCreationData"]
+    # The user created by this run's user chain
+    user_creation_data = data_factory.shared("petStore.userCreationData")
     username = user_creation_data["username"]
     password = user_creation_data["password"]
 
     # Step 1: Perform login request using GET with query parameters
-    login_response = requests.get(f"{BASE_URL}/user/login", params={
-        "username": username,
-        "password": password
-    })
+    login_response = api_client.login(username, password)
 
     # Step 2: Validate the response status
     assert login_response.ok, f"Expected response status 200, but got {login_response.status_code}"
@@ -71,14 +66,12 @@ def test_verify_user_login():
 
     print("Login successful: User is logged in.")
 
-def test_verify_user_logout():
+def test_verify_user_logout(api_client):
     """
     Verify that the API allows logging out the User.
     """
     # Step 1: Perform logout request
-    logout_response = requests.get(f"{BASE_URL}/user/logout", headers={
-        "accept": "application/json"
-    })
+    logout_response = api_client.logout()
 
     # Step 2: Validate the response status
     assert logout_response.ok, f"Expected response status 200, but got {logout_response.status_code}"
@@ -96,15 +89,15 @@ def test_verify_user_logout():
 
     print("Logout successful.")
 
-def test_verify_create_user_list():
+def test_verify_create_user_list(api_client, data_factory):
     """
     Verify that the API allows creating a list of users.
     """
-    # Extract user list data from JSON
-    user_list = test_data["petStore"]["userList"]
+    # Extract user list data from JSON, made unique for this run
+    user_list = data_factory.new("petStore.userList")
 
     # Step 1: Send a POST request to create users with the list
-    response = requests.post(f"{BASE_URL}/user/createWithList", json=user_list)
+    response = api_client.create_users_with_list(user_list)
 
     # Step 2: Validate the response status
     assert response.ok, f"Expected response status 200, but got {response.status_code}"
@@ -122,15 +115,16 @@ def test_verify_create_user_list():
 
     print("User list created successfully.")
 
-def test_verify_add_new_pet():
+@pytest.mark.chain("pet")
+def test_verify_add_new_pet(api_client, chain_id):
     """
     Verify that the API allows adding a new pet.
     """
-    # Extract pet data from JSON
-    pet_data = test_data["petStore"]["petData"]
+    # Extract pet data from JSON, with the id of this run's pet chain
+    pet_data = {**test_data["petStore"]["petData"], "id": chain_id}
 
     # Step 1: Send a POST request to add a new pet
-    response = requests.post(f"{BASE_URL}/pet", json=pet_data)
+    response = api_client.add_pet(pet_data)
 
     # Step 2: Assert the response is OK
     assert response.ok, f"Expected response status 200, but got {response.status_code}"
@@ -150,20 +144,22 @@ def test_verify_add_new_pet():
 
     print("Pet added successfully.")
 
-def test_verify_update_pet():
+@pytest.mark.chain("pet")
+def test_verify_update_pet(api_client, chain_id):
     """
     Verify that the API allows updating a pet's name and status.
     """
     # Extract pet data and update data from JSON
-    pet_id = test_data["petStore"]["petData"]["id"]
+    pet_id = chain_id
     update_data = {
         **test_data["petStore"]["petData"],  # Start with the existing pet data
+        "id": pet_id,
         "name": test_data["petStore"]["updatePetData"]["name"],  # Update name
         "status": test_data["petStore"]["updatePetData"]["status"]  # Update status
     }
 
     # Step 1: Send a PUT request to update the pet
-    response = requests.put(f"{BASE_URL}/pet", json=update_data)
+    response = api_client.update_pet(update_data)
 
     # Step 2: Assert the response is OK
     assert response.ok, f"Expected response status 200, but got {response.status_code}"
@@ -183,15 +179,16 @@ def test_verify_update_pet():
 
     print("Pet updated successfully.")
 
-def test_verify_update_pet_image():
+@pytest.mark.chain("pet")
+def test_verify_update_pet_image(api_client, chain_id):
     """
     Verify that the API allows updating a pet's image while preserving other fields.
     """
-    # Extract the pet ID from test data
-    pet_id = test_data["petStore"]["petData"]["id"]
+    # The pet added by this run's pet chain
+    pet_id = chain_id
 
     # Step 1: Fetch the existing pet data
-    get_response = requests.get(f"{BASE_URL}/pet/{pet_id}")
+    get_response = api_client.get_pet(pet_id)
     assert get_response.ok, f"Failed to fetch pet. Status: {get_response.status_code}"
     assert get_response.status_code == 200, f"Expected 200, but got {get_response.status_code}"
 
@@ -205,7 +202,7 @@ def test_verify_update_pet_image():
     }
 
     # Step 3: Send a PUT request to update the pet
-    put_response = requests.put(f"{BASE_URL}/pet", json=updated_data)
+    put_response = api_client.update_pet(updated_data)
     assert put_response.ok, f"Failed to update pet. Status: {put_response.status_code}"
     assert put_response.status_code == 200, f"Expected 200, but got {put_response.status_code}"
 
@@ -225,15 +222,16 @@ def test_verify_update_pet_image():
 
     print("Pet image updated successfully.")
 
-def test_verify_delete_pet():
+@pytest.mark.chain("pet")
+def test_verify_delete_pet(api_client, chain_id):
     """
     Verify that the API allows deleting a pet.
     """
-    # Extract the pet ID from test data
-    pet_id = test_data["petStore"]["petData"]["id"]
+    # The pet added by this run's pet chain
+    pet_id = chain_id
 
     # Step 1: Send a DELETE request to delete the pet
-    delete_response = requests.delete(f"{BASE_URL}/pet/{pet_id}")
+    delete_response = api_client.delete_pet(pet_id)
 
     # Step 2: Assert the response is OK
     assert delete_response.ok, f"Expected response status 200, but got {delete_response.status_code}"
@@ -251,15 +249,16 @@ def test_verify_delete_pet():
 
     print("Pet deleted successfully.")
 
-def test_verify_pet_not_found():
+@pytest.mark.chain("pet")
+def test_verify_pet_not_found(api_client, chain_id):
     """
     Verify that the deleted pet is no longer retrievable.
     """
-    # Extract the pet ID from test data
-    pet_id = test_data["petStore"]["petData"]["id"]
+    # The pet added by this run's pet chain
+    pet_id = chain_id
 
     # Step 1: Send a GET request to retrieve the deleted pet
-    get_response = requests.get(f"{BASE_URL}/pet/{pet_id}")
+    get_response = api_client.get_pet(pet_id)
 
     # Step 2: Assert the response returns a 404 status
     assert get_response.status_code == 404, \
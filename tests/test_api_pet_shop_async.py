@@ -0,0 +1,75 @@
+import pytest
+import json
+import asyncio
+
+# Load test data from JSON file
+with open("test_data.json", "r") as file:
+    test_data = json.load(file)
+
+@pytest.mark.concurrent
+async def test_verify_user_login_async(async_api_client, data_factory):
+    """
+    Verify that the API allows login as a User.
+    """
+    # The user made unique for this run, as in the synchronous suite
+    user_creation_data = data_factory.shared("petStore.userCreationData")
+
+    # Step 1: Perform login request
+    login_response = await async_api_client.login(user_creation_data["username"], user_creation_data["password"])
+
+    # Step 2: Validate the response
+    assert login_response.status_code == 200, f"Failed to log in. Response: {login_response.text}"
+    login_response_body = login_response.json()
+    assert "logged in" in login_response_body["message"], \
+        f"Expected 'logged in' in the message, but got '{login_response_body['message']}'"
+
+@pytest.mark.concurrent
+async def test_verify_user_logout_async(async_api_client):
+    """
+    Verify that the API allows logging out the User.
+    """
+    # Step 1: Perform logout request
+    logout_response = await async_api_client.logout()
+
+    # Step 2: Validate the response
+    assert logout_response.status_code == 200, f"Failed to log out. Response: {logout_response.text}"
+    logout_response_body = logout_response.json()
+    assert logout_response_body["code"] == 200, \
+        f"Expected response code 200, but got {logout_response_body['code']}"
+    assert logout_response_body["message"] == "ok", \
+        f"Expected message 'ok', but got '{logout_response_body['message']}'"
+
+@pytest.mark.concurrent
+async def test_verify_create_user_list_async(async_api_client, data_factory):
+    """
+    Verify that the API allows creating a list of users.
+    """
+    user_list = data_factory.new("petStore.userList")
+
+    # Step 1: Send a POST request to create users with the list
+    response = await async_api_client.create_users_with_list(user_list)
+
+    # Step 2: Validate the response
+    assert response.status_code == 200, f"Failed to create user list. Response: {response.text}"
+    response_body = response.json()
+    assert response_body["code"] == 200, \
+        f"Expected response code 200, but got {response_body['code']}"
+    assert response_body["message"] == "ok", \
+        f"Expected message 'ok', but got '{response_body['message']}'"
+
+@pytest.mark.concurrent
+async def test_verify_users_from_list_exist_async(async_api_client, data_factory):
+    """
+    Verify that every user of the list can be fetched, requesting all of them at once.
+    """
+    user_list = data_factory.new("petStore.userList")
+    create_response = await async_api_client.create_users_with_list(user_list)
+    assert create_response.status_code == 200, f"Failed to create user list. Response: {create_response.text}"
+
+    # Fetch all users concurrently
+    responses = await asyncio.gather(*(async_api_client.get_user(user["username"]) for user in user_list))
+
+    for user, response in zip(user_list, responses):
+        assert response.status_code == 200, f"Failed to fetch user '{user['username']}'. Status: {response.status_code}"
+        assert response.json()["username"] == user["username"], \
+            f"Expected username '{user['username']}', but got '{response.json()['username']}'"
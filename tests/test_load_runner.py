@@ -0,0 +1,68 @@
+import pytest
+
+from utils.cleanup import CleanupService
+from utils.data_factory import DataFactory
+from utils.load_runner import FLOWS, LoadRunner, LoadStats, RecordingClient, endpoint_name, percentile
+from utils.petstore_stub import PetStoreStub
+
+REPORT_ROW_KEYS = {"requests", "errors", "errorRate", "throughput", "p50Ms", "p95Ms", "p99Ms"}
+
+
+@pytest.mark.parametrize("rate", [None, 40], ids=["closed-loop", "open-loop"])
+def test_load_runner_report(rate):
+    """
+    Verify that a short load run against the local Pet Store stand-in reports every endpoint
+    the flows use, without errors, and leaves nothing behind after cleanup.
+    """
+    factory = DataFactory.from_file("test_data.json", worker_id="load")
+    with PetStoreStub() as stub, RecordingClient(LoadStats(), base_url=stub.base_url, pool_size=4, retries=0,
+                                                 registry=factory.registry) as client:
+        # Step 1: Run every flow for a moment
+        report = LoadRunner(client, factory, list(FLOWS), duration=0.5, concurrency=4, rate=rate).run()
+
+        # Step 2: Validate the shape of the report
+        assert set(report) == {"durationSeconds", "endpoints", "flowErrors", "droppedFlows", "lateStarts"}
+        assert report["flowErrors"] == {}, f"Flows failed: {report['flowErrors']}"
+        assert set(report["endpoints"]) == {
+            "POST /user", "GET /user/{id}", "GET /user/login", "GET /user/logout", "POST /user/createWithList",
+            "POST /pet", "PUT /pet", "GET /pet/{id}", "DELETE /pet/{id}",
+        }
+        for endpoint, row in report["endpoints"].items():
+            assert set(row) == REPORT_ROW_KEYS, f"Unexpected columns for {endpoint}: {sorted(row)}"
+            assert row["requests"] > 0 and row["errors"] == 0, f"{endpoint}: {row}"
+            assert row["p50Ms"] <= row["p95Ms"] <= row["p99Ms"], f"{endpoint}: percentiles out of order"
+
+        # Step 3: Delete the users the flows created (their pets delete themselves)
+        assert factory.registry.pending("pet") == []
+        assert factory.registry.pending("user"), "Expected the user flows to register the users they created"
+        cleanup = CleanupService(client, factory.registry).run()
+        assert not cleanup.failed, cleanup.summary()
+        assert factory.registry.pending() == []
+
+
+@pytest.mark.parametrize("method, path, expected", [
+    ("GET", "/pet/123", "GET /pet/{id}"),
+    ("GET", "/user/testuser_1a2b", "GET /user/{id}"),
+    ("GET", "/user/login?username=a&password=b", "GET /user/login"),
+    ("POST", "/user/createWithList", "POST /user/createWithList"),
+    ("DELETE", "/pet/7/", "DELETE /pet/{id}"),
+])
+def test_endpoint_name(method, path, expected):
+    """
+    Verify that parameterised paths are collapsed into one endpoint per route.
+    """
+    assert endpoint_name(method, path) == expected
+
+
+def test_percentile():
+    """
+    Verify the nearest-rank percentile of a sorted list, including the edge cases.
+    """
+    values = [float(number) for number in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile(values, 1.0) == 100.0
+    assert percentile(values, 0.0) == 1.0
+    assert percentile([0.25], 0.99) == 0.25
+    assert percentile([], 0.50) == 0.0
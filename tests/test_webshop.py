@@ -1,13 +1,12 @@
 import pytest
 import json
 import time
-from selenium.webdriver.support.wait import WebDriverWait
 from pages.home_page import HomePage
-from selenium.webdriver.support import expected_conditions as EC
 from pages.registration_page import RegistrationPage
 from pages.product_list_page import ProductListPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
+from utils.catalog_crawler import CatalogCrawler, browser_renderer
 
 from pages.checkout_page import CheckoutPage
 
@@ -16,18 +15,20 @@ with open('test_data.json', 'r') as file:
     test_data = json.load(file)
 
 @pytest.mark.parametrize("registration_data", [test_data["demoWebShopData"]["registrationData"]])
-def test_verify_user_registration(browser, registration_data):
+def test_verify_user_registration(browser, registration_data, data_factory):
     """
     Verify that the application allows registering a user successfully.
     """
+    # A fresh email for every run, since an email can only be registered once
+    registration_data = data_factory.expand(registration_data)
+
     # Initialize pages
     home_page = HomePage(browser)
     registration_page = RegistrationPage(browser)
 
     # Navigate to the home page and click the register link
     home_page.open()
-    register_link = browser.find_element(*home_page.register_user)
-    register_link.click()
+    home_page.element(home_page.register_user).click()
 
     # Register the user
     registration_page.register_user(
@@ -39,7 +40,7 @@ def test_verify_user_registration(browser, registration_data):
     )
 
     # Verify the registration message is visible
-    registration_message = browser.find_element(*registration_page.registration_message)
+    registration_message = registration_page.element(registration_page.registration_message)
     assert registration_message.is_displayed(), "Registration message is not visible"
 
     # Get and verify the registration message content
@@ -58,8 +59,7 @@ def test_verify_user_login(browser, login_data):
 
     # Navigate to the home page and click the login link
     home_page.open()
-    login_link = browser.find_element(*home_page.login_user)
-    login_link.click()
+    home_page.element(home_page.login_user).click()
 
     # Log in the user
     registration_page.login_user(
@@ -83,8 +83,7 @@ def test_verify_computer_sub_groups(browser, sub_category_titles):
 
     # Navigate to the home page and click the Computers group link
     home_page.open()
-    computers_group = browser.find_element(*home_page.computers_group)
-    computers_group.click()
+    home_page.element(home_page.computers_group).click()
 
     # Verify the subcategory titles
     product_list_page.verify_sub_category_titles(expected_titles=sub_category_titles)
@@ -99,12 +98,43 @@ def test_verify_sort_products_by_price(browser):
 
     # Navigate to the home page and click the Books group link
     home_page.open()
-    books_group = browser.find_element(*home_page.books_group)
-    books_group.click()
+    home_page.open_books()
 
     # Verify the products are sorted by price in ascending order
     product_list_page.verify_sort_by_price()
 
+@pytest.mark.parametrize("sort_order", ["Name: A to Z", "Name: Z to A", "Price: High to Low"])
+def test_verify_sort_products(browser, sort_order):
+    """
+    Verify that the customer can sort the products by name and by price.
+    """
+    # Initialize pages
+    home_page = HomePage(browser)
+    product_list_page = ProductListPage(browser)
+
+    # Navigate to the home page and click the Books group link
+    home_page.open()
+    home_page.open_books()
+
+    # Verify the products follow the selected order
+    product_list_page.verify_sort_order(sort_order)
+
+def test_verify_pagination_of_products(browser):
+    """
+    Verify that the products are split over pages when fewer items are shown per page.
+    """
+    # Initialize pages
+    home_page = HomePage(browser)
+    product_list_page = ProductListPage(browser)
+
+    # Navigate to the home page and click the Books group link
+    home_page.open()
+    home_page.open_books()
+
+    # Verify every page is full except the last and no product repeats
+    pages = product_list_page.verify_pagination(page_size='4')
+    assert len(pages) > 1, "Expected the books to span more than one page at 4 per page"
+
 def test_verify_change_number_of_items_on_page(browser):
     """
     Verify that the customer can change the number of items displayed on the page.
@@ -115,8 +145,7 @@ def test_verify_change_number_of_items_on_page(browser):
 
     # Navigate to the home page and click the Books group link
     home_page.open()
-    books_group = browser.find_element(*home_page.books_group)
-    books_group.click()
+    home_page.open_books()
 
     # Verify that the number of items can be changed
     product_list_page.change_number_of_items()
@@ -131,15 +160,15 @@ def test_verify_add_product_to_wishlist(browser):
 
     # Navigate to the home page and click the Books group link
     home_page.open()
-    books_group = browser.find_element(*home_page.books_group)
-    books_group.click()
+    home_page.open_books()
 
     # Verify that the wishlist button is visible
-    wishlist_button = browser.find_element(*home_page.wishlist_button)
+    wishlist_button = home_page.element(home_page.wishlist_button)
     assert wishlist_button.is_displayed(), "Wishlist button is not visible"
 
     # Check the initial number of items in the wishlist
-    wishlist_quantity_text = browser.find_element(*home_page.wishlist_quantity).text
+    wishlist_quantity = home_page.element(home_page.wishlist_quantity)
+    wishlist_quantity_text = wishlist_quantity.text
     initial_wishlist_count = int(''.join(filter(str.isdigit, wishlist_quantity_text)))
     assert initial_wishlist_count == 0, f"Expected 0 items in the wishlist, but found {initial_wishlist_count}"
 
@@ -147,7 +176,7 @@ def test_verify_add_product_to_wishlist(browser):
     product_list_page.add_product_to_wishlist()
 
     # Verify the number of items in the wishlist after adding a product
-    wishlist_quantity_text_after = browser.find_element(*home_page.wishlist_quantity).text
+    wishlist_quantity_text_after = wishlist_quantity.text
     updated_wishlist_count = int(''.join(filter(str.isdigit, wishlist_quantity_text_after)))
     assert updated_wishlist_count == 1, f"Expected 1 item in the wishlist, but found {updated_wishlist_count}"
 
@@ -162,15 +191,15 @@ def test_verify_add_product_to_cart(browser):
 
     # Step 1: Navigate to the homepage and click the Books group
     home_page.open()
-    books_group = browser.find_element(*home_page.books_group)
-    books_group.click()
+    home_page.open_books()
 
     # Step 2: Verify the cart button is visible
-    cart_button = browser.find_element(*home_page.cart_button)
+    cart_button = home_page.element(home_page.cart_button)
     assert cart_button.is_displayed(), "Cart button is not visible"
 
     # Step 3: Verify the initial cart count is 0
-    initial_cart_text = browser.find_element(*home_page.cart_quantity).text
+    cart_quantity = home_page.element(home_page.cart_quantity)
+    initial_cart_text = cart_quantity.text
     initial_cart_count = int(''.join(filter(str.isdigit, initial_cart_text)))
     assert initial_cart_count == 0, f"Expected 0 items in the cart, but found {initial_cart_count}"
 
@@ -178,12 +207,10 @@ def test_verify_add_product_to_cart(browser):
     added_product_details = product_list_page.add_product_to_cart()
 
     # Step 5: Wait until the cart quantity updates to 1
-    WebDriverWait(browser, 10).until(
-        EC.text_to_be_present_in_element(home_page.cart_quantity, "1")
-    )
+    cart_quantity.text_contains("1")
 
     # Verify cart count is updated
-    cart_quantity_text_after = browser.find_element(*home_page.cart_quantity).text
+    cart_quantity_text_after = cart_quantity.text
     updated_cart_count = int(''.join(filter(str.isdigit, cart_quantity_text_after)))
     assert updated_cart_count == 1, f"Expected 1 item in the cart, but found {updated_cart_count}"
 
@@ -201,73 +228,53 @@ def test_verify_add_product_to_cart(browser):
     assert product_details_in_cart["productQty"] == 1, \
         f"Expected product quantity '1' but got '{product_details_in_cart['productQty']}'"
 
-def test_verify_remove_product_from_cart(browser):
+def test_verify_remove_product_from_cart(browser, state_seeder):
     """
     Verify that the customer can remove a product from the cart.
     """
     # Initialize pages
     home_page = HomePage(browser)
-    product_list_page = ProductListPage(browser)
     cart_page = CartPage(browser)
 
-    # Step 1: Navigate to the homepage and click the Books group
+    # Step 1: Navigate to the homepage
     home_page.open()
-    books_group = browser.find_element(*home_page.books_group)
-    books_group.click()
 
-    # Step 2: Add a product to the cart
-    product_list_page.add_product_to_cart()
+    # Step 2: Put a product in the cart over HTTP on the browser's session
+    state_seeder.add_to_cart(test_data["demoWebShopData"]["seedProductId"])
 
-    # Step 3: Click the cart button to navigate to the cart page
-    cart_button = browser.find_element(*home_page.cart_button)
-    cart_button.click()
+    # Step 3: Navigate to the cart page
+    cart_page.open()
 
     # Step 4: Remove the product from the cart
     cart_page.remove_product_from_cart()
 
     # Step 5: Verify the cart quantity is updated to 0
-    WebDriverWait(browser, 10).until(
-        EC.text_to_be_present_in_element(home_page.cart_quantity, "0")
-    )
-
-    cart_quantity_text = browser.find_element(*home_page.cart_quantity).text
+    cart_quantity = home_page.element(home_page.cart_quantity).text_contains("0")
+    cart_quantity_text = cart_quantity.text
     updated_cart_count = int(''.join(filter(str.isdigit, cart_quantity_text)))
     assert updated_cart_count == 0, f"Expected 0 items in the cart, but found {updated_cart_count}"
 
     # Step 6: Verify the empty cart message
-    empty_cart_message = WebDriverWait(browser, 10).until(
-        EC.visibility_of_element_located(cart_page.order_summary_message)
-    ).text.strip()
+    empty_cart_message = cart_page.element(cart_page.order_summary_message).visible().text.strip()
     assert empty_cart_message == "Your Shopping Cart is empty!", \
         f"Expected 'Your Shopping Cart is empty!', but got '{empty_cart_message}'"
 
-def test_verify_customer_checkout(browser):
+def test_verify_customer_checkout(browser, login_as, state_seeder):
     """
     Verify that the customer can successfully checkout a product.
     """
     # Initialize pages
-    home_page = HomePage(browser)
-    product_list_page = ProductListPage(browser)
     cart_page = CartPage(browser)
     checkout_page = CheckoutPage(browser)
-    registration_page = RegistrationPage(browser)
 
-    # Step 1: Navigate to the home page and login
-    home_page.open()
-    login_link = browser.find_element(*home_page.login_user)
-    login_link.click()
-
-    login_data = test_data["demoWebShopData"]["loginData"]
-    registration_page.login_user(email=login_data["email"], password=login_data["password"])
+    # Step 1: Log in (reusing the cached session when available) and open the home page
+    login_as(test_data["demoWebShopData"]["loginData"])
 
-    # Step 2: Click the Books group and add a product to the cart
-    books_group = browser.find_element(*home_page.books_group)
-    books_group.click()
-    added_product_details = product_list_page.add_product_to_cart()
+    # Step 2: Put a product in the cart over HTTP on the logged-in session
+    state_seeder.add_to_cart(test_data["demoWebShopData"]["seedProductId"])
 
     # Step 3: Navigate to the cart and proceed to checkout
-    cart_button = browser.find_element(*home_page.cart_button)
-    cart_button.click()
+    cart_page.open()
     cart_page.navigate_to_checkout()
 
     # Step 4: Confirm all checkout steps
@@ -282,4 +289,25 @@ def test_verify_customer_checkout(browser):
     order_confirmation_message = checkout_page.get_order_confirmation_message()
     expected_message = test_data["demoWebShopData"]["orderConfirmMessage"]
     assert order_confirmation_message == expected_message, \
-        f"Expected '{expected_message}' but got '{order_confirmation_message}'"
\ No newline at end of file
+        f"Expected '{expected_message}' but got '{order_confirmation_message}'"
+
+def test_verify_catalog_crawl(request):
+    """
+    Verify the structure, prices and links of every category and product page, crawled over HTTP.
+    """
+    workers = request.config.getoption("--crawl")
+    if not workers:
+        pytest.skip("catalog crawl not requested (--crawl WORKERS)")
+
+    # The browser is only started for pages whose content needs JavaScript
+    crawler = CatalogCrawler(
+        workers=workers, render=lambda url: browser_renderer(request.getfixturevalue("browser"))(url)
+    )
+    try:
+        report = crawler.crawl()
+    finally:
+        crawler.close()
+
+    print(report.summary())
+    assert report.pages["product"] > 0, "The crawl found no product pages"
+    assert not report.issues, report.summary()
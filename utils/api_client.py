@@ -0,0 +1,97 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = "https://petstore.swagger.io/v2"
+
+
+class PetStoreClient:
+    """Pet Store API client backed by a pooled keep-alive session, so connections are reused across calls."""
+
+    def __init__(self, base_url=BASE_URL, pool_size=10, retries=3, backoff_factor=0.3, timeout=10, registry=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+        # Optional EntityRegistry that records every user and pet this client creates
+        self.registry = registry
+
+        # Retry connection errors and gateway hiccups; POST is never retried to avoid duplicate records
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.headers.update({"accept": "application/json", "Connection": "keep-alive"})
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Close every pooled connection
+    def close(self):
+        self.session.close()
+
+    # Send a request to an endpoint relative to the base URL
+    def request(self, method, path, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, f"{self.base_url}{path}", **kwargs)
+
+    def _track(self, response, kind, keys, created=True):
+        if self.registry is not None and response.ok:
+            for key in keys:
+                if created:
+                    self.registry.add(kind, key)
+                else:
+                    self.registry.discard(kind, key)
+        return response
+
+    # User endpoints
+    def create_user(self, user):
+        """POST /user"""
+        return self._track(self.request("POST", "/user", json=user), "user", [user["username"]])
+
+    def get_user(self, username):
+        """GET /user/{username}"""
+        return self.request("GET", f"/user/{username}")
+
+    def login(self, username, password):
+        """GET /user/login"""
+        return self.request("GET", "/user/login", params={"username": username, "password": password})
+
+    def logout(self):
+        """GET /user/logout"""
+        return self.request("GET", "/user/logout")
+
+    def delete_user(self, username):
+        """DELETE /user/{username}"""
+        return self._track(self.request("DELETE", f"/user/{username}"), "user", [username], created=False)
+
+    def create_users_with_list(self, users):
+        """POST /user/createWithList"""
+        response = self.request("POST", "/user/createWithList", json=users)
+        return self._track(response, "user", [user["username"] for user in users])
+
+    # Pet endpoints
+    def add_pet(self, pet):
+        """POST /pet"""
+        return self._track(self.request("POST", "/pet", json=pet), "pet", [pet["id"]])
+
+    def update_pet(self, pet):
+        """PUT /pet"""
+        return self.request("PUT", "/pet", json=pet)
+
+    def get_pet(self, pet_id):
+        """GET /pet/{petId}"""
+        return self.request("GET", f"/pet/{pet_id}")
+
+    def delete_pet(self, pet_id):
+        """DELETE /pet/{petId}"""
+        return self._track(self.request("DELETE", f"/pet/{pet_id}"), "pet", [pet_id], created=False)
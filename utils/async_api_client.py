@@ -0,0 +1,64 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncPetStoreClient:
+    """Awaitable counterpart of PetStoreClient.
+
+    Calls are dispatched to a bounded thread pool sharing the wrapped client's keep-alive
+    connection pool, so many coroutines can have requests in flight at the same time.
+    """
+
+    def __init__(self, client, concurrency=10):
+        self.client = client
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="petstore")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    # Stop the dispatch threads; the wrapped client is left open for its owner to close
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    async def _call(self, method, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args))
+
+    async def request(self, method, path, **kwargs):
+        return await self._call(functools.partial(self.client.request, method, path, **kwargs))
+
+    # User endpoints
+    async def create_user(self, user):
+        return await self._call(self.client.create_user, user)
+
+    async def get_user(self, username):
+        return await self._call(self.client.get_user, username)
+
+    async def login(self, username, password):
+        return await self._call(self.client.login, username, password)
+
+    async def logout(self):
+        return await self._call(self.client.logout)
+
+    async def delete_user(self, username):
+        return await self._call(self.client.delete_user, username)
+
+    async def create_users_with_list(self, users):
+        return await self._call(self.client.create_users_with_list, users)
+
+    # Pet endpoints
+    async def add_pet(self, pet):
+        return await self._call(self.client.add_pet, pet)
+
+    async def update_pet(self, pet):
+        return await self._call(self.client.update_pet, pet)
+
+    async def get_pet(self, pet_id):
+        return await self._call(self.client.get_pet, pet_id)
+
+    async def delete_pet(self, pet_id):
+        return await self._call(self.client.delete_pet, pet_id)
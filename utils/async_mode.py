@@ -0,0 +1,140 @@
+import asyncio
+import inspect
+
+import pytest
+from _pytest.skipping import evaluate_skip_marks
+
+event_loop_key = pytest.StashKey[asyncio.AbstractEventLoop]()
+batch_results_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--async-api", action="store_true", default=False,
+        help="Run async tests marked 'concurrent' together on one event loop instead of one by one"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "concurrent: async test with no ordering dependency; may only use session-scoped fixtures",
+    )
+    config.stash[batch_results_key] = {}
+
+
+def pytest_unconfigure(config):
+    loop = config.stash.get(event_loop_key, None)
+    if loop is not None:
+        loop.close()
+
+
+def get_event_loop(config):
+    """Returns the event loop shared by every async test of the session."""
+    if event_loop_key not in config.stash:
+        config.stash[event_loop_key] = asyncio.new_event_loop()
+    return config.stash[event_loop_key]
+
+
+def _is_concurrent(item):
+    return (
+        isinstance(item, pytest.Function)
+        and inspect.iscoroutinefunction(item.obj)
+        and item.get_closest_marker("concurrent") is not None
+    )
+
+
+def _fixture_scope_errors(item):
+    """The fixtures a concurrent test requests that are not session-scoped."""
+    callspec = getattr(item, "callspec", None)
+    params = callspec.params if callspec is not None else {}
+    definitions = item._fixtureinfo.name2fixturedefs
+    return [
+        f"{name} ({definitions[name][-1].scope})"
+        for name in inspect.signature(item.obj).parameters
+        if name not in params and name in definitions and definitions[name][-1].scope != "session"
+    ]
+
+
+def pytest_collection_modifyitems(config, items):
+    """Reject concurrent tests that break the session-fixtures-only rule, before anything runs."""
+    errors = [
+        f"{item.nodeid}: {', '.join(scopes)}"
+        for item in items if _is_concurrent(item)
+        for scopes in [_fixture_scope_errors(item)] if scopes
+    ]
+    if errors:
+        raise pytest.UsageError(
+            "Tests marked 'concurrent' may only use session-scoped fixtures, since they run together on one "
+            "event loop outside their own setup:\n  " + "\n  ".join(errors)
+        )
+
+
+def _call_arguments(pyfuncitem, item):
+    """Resolves the arguments of another test through the running test's request (session fixtures only)."""
+    params = getattr(item, "callspec", None)
+    params = params.params if params is not None else {}
+    arguments = {}
+    for name in inspect.signature(item.obj).parameters:
+        if name in params:
+            arguments[name] = params[name]
+        else:
+            arguments[name] = pyfuncitem._request.getfixturevalue(name)
+    return arguments
+
+
+async def _gather(coroutines):
+    return await asyncio.gather(*coroutines, return_exceptions=True)
+
+
+def _may_run_early(item):
+    """Whether a test's body may run ahead of its turn: not skipped and not behind a failed chain step."""
+    from utils.chains import chain_name, failed_steps_key  # Plugin module: imported late so pytest registers it first
+    if evaluate_skip_marks(item) is not None:
+        return False
+    name = chain_name(item)
+    return not (name and name in item.config.stash[failed_steps_key])
+
+
+# Run every concurrent test that has not run yet in one gather() and keep the outcomes
+def _run_batch(pyfuncitem):
+    results = pyfuncitem.config.stash[batch_results_key]
+    batch = [
+        item for item in pyfuncitem.session.items
+        if _is_concurrent(item) and item.nodeid not in results
+        and (item is pyfuncitem or _may_run_early(item))
+    ]
+    # A test whose arguments cannot be resolved fails on its own; the others still run
+    runnable = []
+    for item in batch:
+        try:
+            runnable.append((item, item.obj(**_call_arguments(pyfuncitem, item))))
+        except Exception as error:
+            results[item.nodeid] = error
+    outcomes = get_event_loop(pyfuncitem.config).run_until_complete(
+        _gather([coroutine for _, coroutine in runnable])
+    )
+    for (item, _), outcome in zip(runnable, outcomes):
+        results[item.nodeid] = outcome
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Run coroutine tests on the shared loop, batching the concurrent ones in --async-api mode."""
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+
+    # With --maxfail/-x the session may stop after any test, so nothing runs ahead of its turn
+    batching = pyfuncitem.config.getoption("--async-api") and not pyfuncitem.config.option.maxfail
+    if batching and _is_concurrent(pyfuncitem):
+        results = pyfuncitem.config.stash[batch_results_key]
+        if pyfuncitem.nodeid not in results:
+            _run_batch(pyfuncitem)
+        outcome = results[pyfuncitem.nodeid]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return True
+
+    arguments = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    get_event_loop(pyfuncitem.config).run_until_complete(pyfuncitem.obj(**arguments))
+    return True
@@ -0,0 +1,60 @@
+import threading
+
+from pages.home_page import HomePage
+from pages.registration_page import RegistrationPage
+
+# Cookie attributes accepted by WebDriver's add_cookie
+COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+class AuthSessionCache:
+    """Logs in through the UI once per set of credentials and replays the auth cookies into other browsers."""
+
+    def __init__(self):
+        self._cookies = {}
+        self._lock = threading.Lock()
+        self.ui_logins = 0
+        self.cookie_logins = 0
+
+    # Make the browser logged in as the given user, through the cache when possible
+    def login(self, driver, email, password):
+        with self._lock:
+            cookies = self._cookies.get(email)
+
+        if cookies is not None:
+            if self._inject(driver, cookies):
+                self.cookie_logins += 1
+                return
+            # The server rejected the cookie (expired or signed out elsewhere)
+            self.invalidate(email)
+
+        cookies = self._login_through_form(driver, email, password)
+        with self._lock:
+            self._cookies[email] = cookies
+        self.ui_logins += 1
+
+    def invalidate(self, email):
+        with self._lock:
+            self._cookies.pop(email, None)
+
+    @staticmethod
+    def _login_through_form(driver, email, password):
+        home_page = HomePage(driver)
+        home_page.open()
+        driver.find_element(*home_page.login_user).click()
+        RegistrationPage(driver).login_user(email=email, password=password, fast=True)
+
+        actual_email = home_page.get_account_email()
+        assert email in actual_email, f"Login as '{email}' failed, header shows '{actual_email}'"
+        return driver.get_cookies()
+
+    @staticmethod
+    def _inject(driver, cookies):
+        """Adds the cookies to the browser and checks the server still treats them as logged in."""
+        home_page = HomePage(driver)
+        home_page.open()  # Cookies can only be set for the domain currently loaded
+        driver.delete_all_cookies()
+        for cookie in cookies:
+            driver.add_cookie({field: cookie[field] for field in COOKIE_FIELDS if field in cookie})
+        driver.refresh()
+        return bool(driver.find_elements(*home_page.logged_in_account))
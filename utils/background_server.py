@@ -0,0 +1,36 @@
+import threading
+from http.server import ThreadingHTTPServer
+
+
+class BackgroundServer:
+    """Serves a request handler on a background thread; use as a context manager or start()/stop()."""
+
+    base_path = "/"
+    thread_name = "background-server"
+
+    def __init__(self, handler, host="127.0.0.1", port=0):
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{self.base_path}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name=self.thread_name, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
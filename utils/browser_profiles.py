@@ -0,0 +1,117 @@
+import atexit
+import shutil
+import tempfile
+
+from selenium import webdriver
+
+# Chrome switches that stop the browser spending time on things a test never looks at
+LOW_OVERHEAD_CHROME_ARGUMENTS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+]
+
+
+class BrowserProfile:
+    """Named set of launch settings, selected with --browser <name>:<profile>."""
+
+    def __init__(self, name, description, headless=False, window_size=None, page_load_strategy="normal",
+                 chrome_arguments=(), use_user_data_template=False):
+        self.name = name
+        self.description = description
+        self.headless = headless
+        self.window_size = window_size
+        self.page_load_strategy = page_load_strategy
+        self.chrome_arguments = list(chrome_arguments)
+        self.use_user_data_template = use_user_data_template
+
+    def chrome_options(self, user_data_template=None):
+        options = webdriver.ChromeOptions()
+        options.page_load_strategy = self.page_load_strategy
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.window_size:
+            options.add_argument("--window-size={},{}".format(*self.window_size))
+        for argument in self.chrome_arguments:
+            options.add_argument(argument)
+        if self.use_user_data_template and user_data_template:
+            options.add_argument(f"--user-data-dir={copy_user_data_template(user_data_template)}")
+        return options
+
+    def firefox_options(self):
+        options = webdriver.FirefoxOptions()
+        options.page_load_strategy = self.page_load_strategy
+        if self.headless:
+            options.add_argument("-headless")
+        if self.window_size:
+            options.add_argument(f"--width={self.window_size[0]}")
+            options.add_argument(f"--height={self.window_size[1]}")
+        return options
+
+    # Size the window once the browser is up
+    def apply_window(self, driver):
+        if self.window_size:
+            driver.set_window_size(*self.window_size)
+        elif not self.headless:
+            driver.maximize_window()
+
+
+PROFILES = {
+    profile.name: profile for profile in (
+        BrowserProfile("default", "headed, maximized, normal page load"),
+        BrowserProfile(
+            "headless", "headless new mode, 1280x800 viewport",
+            headless=True, window_size=(1280, 800),
+        ),
+        BrowserProfile(
+            "fast", "headless new mode, low-overhead switches, 1280x800 viewport, eager page load",
+            headless=True, window_size=(1280, 800), page_load_strategy="eager",
+            chrome_arguments=LOW_OVERHEAD_CHROME_ARGUMENTS,
+        ),
+        BrowserProfile(
+            "ci", "as 'fast', started from the --user-data-template profile directory",
+            headless=True, window_size=(1280, 800), page_load_strategy="eager",
+            chrome_arguments=LOW_OVERHEAD_CHROME_ARGUMENTS, use_user_data_template=True,
+        ),
+    )
+}
+
+
+def parse_browser_option(value):
+    """Splits a --browser value such as "chrome:fast" into the browser name and its profile."""
+    browser_name, _, profile_name = value.partition(":")
+    profile_name = profile_name or "default"
+    if profile_name not in PROFILES:
+        raise ValueError(f"Unknown browser profile '{profile_name}', choose from {sorted(PROFILES)}")
+    return browser_name, PROFILES[profile_name]
+
+
+def copy_user_data_template(template_dir):
+    """Copies the template to a throw-away directory so every browser starts from the same profile."""
+    user_data_dir = tempfile.mkdtemp(prefix="webshop-profile-")
+    shutil.copytree(template_dir, user_data_dir, dirs_exist_ok=True)
+    atexit.register(shutil.rmtree, user_data_dir, ignore_errors=True)
+    return user_data_dir
+
+
+def launch_browser(browser_name, profile=PROFILES["default"], network=None, user_data_template=None):
+    """Start a new instance of the selected browser with the given profile."""
+    if browser_name == "chrome":
+        options = profile.chrome_options(user_data_template)
+        if network:
+            network.configure_chrome(options)
+        driver = webdriver.Chrome(options=options)  # Ensure chromedriver is in PATH
+        if network:
+            network.attach(driver)
+    elif browser_name == "firefox":
+        driver = webdriver.Firefox(options=profile.firefox_options())  # Ensure geckodriver is in PATH
+    else:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+    profile.apply_window(driver)
+    return driver
@@ -0,0 +1,358 @@
+"""Crawls the whole catalog over plain HTTP and validates every category and product page.
+
+The category tree is discovered from the top navigation of the home page. Listing pages
+(including their subcategories and further pages) and product pages are fetched concurrently
+with a pooled requests session and parsed with the standard library HTML parser. Only pages
+whose content is not in the served HTML are rendered in a browser, one at a time.
+
+Usage:
+    python -m utils.catalog_crawler --workers 16
+    python -m utils.catalog_crawler --max-pages 200 --browser chrome:fast --json crawl.json
+"""
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urldefrag, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from pages.base_page import BasePage
+
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source",
+                 "track", "wbr"}
+
+
+class Node:
+    """Element of the parsed document, with just enough querying for the checks below."""
+
+    def __init__(self, tag, attrs, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs)
+        self.parent = parent
+        self.children = []
+        self.text_parts = []
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    def text(self):
+        return " ".join(" ".join(part for part in self._texts()).split())
+
+    def _texts(self):
+        yield from self.text_parts
+        for child in self.children:
+            yield from child._texts()
+
+    def iter(self):
+        for child in self.children:
+            yield child
+            yield from child.iter()
+
+    def find_all(self, tag=None, class_name=None, **attrs):
+        return [
+            node for node in self.iter()
+            if (tag is None or node.tag == tag)
+            and (class_name is None or class_name in node.classes)
+            and all(node.attrs.get(name) == value for name, value in attrs.items())
+        ]
+
+    def find(self, tag=None, class_name=None, **attrs):
+        found = self.find_all(tag, class_name, **attrs)
+        return found[0] if found else None
+
+
+class TreeBuilder(HTMLParser):
+    """Builds a Node tree; tolerant of the unclosed tags real pages contain."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document", {})
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, [(name, value or "") for name, value in attrs], self.current)
+        self.current.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self.current.children.append(Node(tag, [(name, value or "") for name, value in attrs], self.current))
+
+    def handle_endtag(self, tag):
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.text_parts.append(data)
+
+
+def parse_html(html):
+    builder = TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+def parse_price(text):
+    digits = re.sub(r"[^0-9.]", "", text or "")
+    try:
+        return float(digits)
+    except ValueError:
+        return None
+
+
+class CrawlReport:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pages = {"category": 0, "product": 0}
+        self.issues = []
+        self.rendered = []
+        self.skipped = 0  # Links not followed once the page limit was reached
+        self.fetch_seconds = 0.0
+        self.seconds = 0.0
+
+    def page(self, kind):
+        with self.lock:
+            self.pages[kind] += 1
+
+    def issue(self, url, message):
+        with self.lock:
+            self.issues.append({"url": url, "message": message})
+
+    def as_dict(self):
+        return {"pages": self.pages, "issues": self.issues, "renderedInBrowser": self.rendered,
+                "skippedLinks": self.skipped, "fetchSeconds": self.fetch_seconds, "seconds": self.seconds}
+
+    def summary(self):
+        lines = [
+            f"crawled {self.pages['category']} category page(s) and {self.pages['product']} product page(s) "
+            f"in {self.seconds:.1f}s, {len(self.rendered)} rendered in a browser, {len(self.issues)} issue(s)"
+        ]
+        lines.extend(f"  {issue['url']}: {issue['message']}" for issue in self.issues[:50])
+        return "\n".join(lines)
+
+
+class CatalogCrawler:
+    """Breadth-first crawl of categories, their pages and their products, ``workers`` requests at a time."""
+
+    def __init__(self, base_url=BasePage.base_url, workers=16, max_pages=5000, timeout=15, render=None):
+        self.base_url = base_url
+        self.host = urlparse(base_url).netloc
+        self.workers = workers
+        self.max_pages = max_pages
+        self.timeout = timeout
+        # Callable url -> HTML rendered by a browser, for pages that need JavaScript; None to only report them
+        self.render = render
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.report = CrawlReport()
+        self._seen = set()
+        self._listing_prices = {}
+        self._needs_browser = []
+
+    def close(self):
+        self.session.close()
+
+    def _url(self, href, page_url):
+        url, _ = urldefrag(urljoin(page_url, href))
+        return url if urlparse(url).netloc == self.host else None
+
+    def _fetch(self, url):
+        start = time.perf_counter()
+        response = self.session.get(url, timeout=self.timeout)
+        with self.report.lock:
+            self.report.fetch_seconds += time.perf_counter() - start
+        return response
+
+    # Category tree from the top navigation (top-level groups and their dropdown sublists)
+    def discover_categories(self):
+        response = self._fetch(self.base_url)
+        response.raise_for_status()
+        menu = parse_html(response.text).find("ul", class_name="top-menu")
+        if menu is None:
+            raise AssertionError(f"No .top-menu navigation on {self.base_url}")
+        return [
+            url for url in dict.fromkeys(self._url(link.attrs.get("href", ""), self.base_url)
+                                         for link in menu.find_all("a"))
+            if url
+        ]
+
+    # Checks of a listing page; returns the links to crawl next, or None when the HTML has no catalog content
+    def check_category(self, url, document):
+        sub_categories = [
+            self._url(link.attrs.get("href", ""), url)
+            for item in document.find_all(class_name="sub-category-item")
+            for link in item.find_all("a")[:1]
+        ]
+        products = document.find_all(class_name="product-item")
+        if not sub_categories and not products:
+            return None
+
+        links = [link for link in sub_categories if link]
+        for product in products:
+            title_link = next(iter(product.find_all(class_name="product-title")), None)
+            anchor = title_link.find("a") if title_link else None
+            price_node = product.find(class_name="actual-price")
+            price = parse_price(price_node.text()) if price_node else None
+            product_id = product.attrs.get("data-productid")
+            name = anchor.text() if anchor else None
+            if not anchor or not name:
+                self.report.issue(url, f"product box {product_id} has no title link")
+                continue
+            if price is None or price <= 0:
+                shown = price_node.text() if price_node else None
+                self.report.issue(url, f"product '{name}' has no valid price ({shown})")
+            product_url = self._url(anchor.attrs.get("href", ""), url)
+            if product_url:
+                links.append(product_url)
+                if price is not None:
+                    self._listing_prices.setdefault(product_url, (price, url))
+
+        # Further pages of the same listing
+        pager = document.find(class_name="pager")
+        if pager:
+            links.extend(filter(None, (self._url(link.attrs.get("href", ""), url) for link in pager.find_all("a"))))
+        return links
+
+    # Checks of a product page; None when the HTML has no product content
+    def check_product(self, url, document):
+        essential = document.find(class_name="product-essential")
+        if essential is None:
+            return None
+        name_node = essential.find(class_name="product-name")
+        name = name_node.text() if name_node else ""
+        if not name:
+            self.report.issue(url, "product page has no name")
+        price_node = essential.find(class_name="product-price")
+        price = parse_price(price_node.text()) if price_node else None
+        if price is None or price <= 0:
+            self.report.issue(url, f"product '{name}' has no valid price")
+        listed = self._listing_prices.get(url)
+        if listed and price is not None and abs(listed[0] - price) > 0.005:
+            self.report.issue(url, f"price {price:.2f} differs from {listed[0]:.2f} on the listing {listed[1]}")
+        if not essential.find_all(class_name="add-to-cart-button") and not essential.find(class_name="stock"):
+            self.report.issue(url, f"product '{name}' has neither an add-to-cart button nor stock information")
+        return []
+
+    def _classify(self, url, document):
+        """Runs the matching checks; returns (kind, links) or (None, None) when nothing matched."""
+        links = self.check_product(url, document)
+        if links is not None:
+            return "product", links
+        links = self.check_category(url, document)
+        if links is not None:
+            return "category", links
+        return None, None
+
+    def _visit(self, url):
+        try:
+            response = self._fetch(url)
+        except requests.RequestException as error:
+            self.report.issue(url, f"request failed: {error}")
+            return []
+        if response.status_code != 200:
+            self.report.issue(url, f"HTTP {response.status_code}")
+            return []
+        kind, links = self._classify(url, parse_html(response.text))
+        if kind is None:
+            with self.report.lock:
+                self._needs_browser.append(url)
+            return []
+        self.report.page(kind)
+        return links
+
+    def _enqueue(self, urls):
+        fresh = []
+        with self.report.lock:
+            for url in urls:
+                if url in self._seen:
+                    continue
+                if len(self._seen) >= self.max_pages:
+                    self.report.skipped += 1
+                    continue
+                self._seen.add(url)
+                fresh.append(url)
+        return fresh
+
+    def crawl(self):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="crawler") as executor:
+            pending = {executor.submit(self._visit, url) for url in self._enqueue(self.discover_categories())}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.update(executor.submit(self._visit, url) for url in self._enqueue(future.result()))
+        if self.report.skipped:
+            # A truncated crawl must not pass as a clean one
+            self.report.issue(
+                self.base_url,
+                f"stopped at the limit of {self.max_pages} pages; "
+                f"{self.report.skipped} link(s) to unvisited pages not followed"
+            )
+
+        # Browser fallback, one page at a time, only for what the plain HTML did not contain
+        for url in self._needs_browser:
+            if self.render is None:
+                self.report.issue(url, "no catalog content in the served HTML (needs JavaScript?)")
+                continue
+            self.report.rendered.append(url)
+            kind, _ = self._classify(url, parse_html(self.render(url)))
+            if kind is None:
+                self.report.issue(url, "no catalog content, even when rendered in a browser")
+            else:
+                self.report.page(kind)
+        self.report.seconds = time.perf_counter() - start
+        return self.report
+
+
+def browser_renderer(driver):
+    """Renders a page in an already running browser and returns its DOM as HTML."""
+    def render(url):
+        driver.get(url)
+        return driver.page_source
+    return render
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Crawl and validate every category and product page.")
+    parser.add_argument("--base-url", default=BasePage.base_url)
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent HTTP requests")
+    parser.add_argument("--max-pages", type=int, default=5000)
+    parser.add_argument("--browser", help="browser[:profile] used for pages that need JavaScript, e.g. chrome:fast")
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    driver = None
+    if args.browser:
+        from utils.browser_profiles import launch_browser, parse_browser_option
+        driver = launch_browser(*parse_browser_option(args.browser))
+    crawler = CatalogCrawler(args.base_url, args.workers, args.max_pages,
+                             render=browser_renderer(driver) if driver else None)
+    try:
+        report = crawler.crawl()
+    finally:
+        crawler.close()
+        if driver:
+            driver.quit()
+
+    print(report.summary())
+    if args.json_path:
+        with open(args.json_path, "w") as file:
+            json.dump(report.as_dict(), file, indent=2)
+    return 1 if report.issues else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
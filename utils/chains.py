@@ -0,0 +1,62 @@
+"""Dependency chains: tests that build on each other's server-side state.
+
+Every test marked ``@pytest.mark.chain("<name>")`` is a step of that chain, in collection order.
+A chain always runs on one worker and in order, different chains may run in parallel, and once
+a step fails the remaining steps are skipped instead of running against missing state. Steps
+share a ``chain_id`` that is unique per chain and run, so concurrent runs never touch the same record.
+"""
+import uuid
+
+import pytest
+
+failed_steps_key = pytest.StashKey[dict]()
+chain_ids_key = pytest.StashKey[dict]()
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "chain(name): step of a dependency chain; steps run in file order on one worker "
+        "and are skipped once an earlier step failed",
+    )
+    config.stash[failed_steps_key] = {}
+    config.stash[chain_ids_key] = {}
+
+
+def chain_name(item):
+    marker = item.get_closest_marker("chain")
+    return marker.args[0] if marker else None
+
+
+def unique_id():
+    """Positive id that fits in a JSON number without losing precision (53 bits)."""
+    return uuid.uuid4().int >> 75
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Skip a step before its fixtures are set up when an earlier step of its chain failed."""
+    name = chain_name(item)
+    failed_step = item.config.stash[failed_steps_key].get(name) if name else None
+    if failed_step:
+        pytest.skip(f"upstream step {failed_step} of chain '{name}' failed")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    name = chain_name(item)
+    if name and report.failed:
+        item.config.stash[failed_steps_key].setdefault(name, item.nodeid)
+
+
+@pytest.fixture
+def chain_id(request):
+    """Unique id shared by every step of the test's chain in this run."""
+    name = chain_name(request.node)
+    assert name, f"{request.node.nodeid} uses chain_id but is not marked with a chain"
+    ids = request.config.stash[chain_ids_key]
+    if name not in ids:
+        ids[name] = unique_id()
+    return ids[name]
@@ -0,0 +1,109 @@
+"""Deletes the users and pets a test run created, many at a time.
+
+Usage:
+    python -m utils.cleanup --registry created.jsonl --workers 16
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.api_client import BASE_URL, PetStoreClient
+from utils.data_factory import EntityRegistry
+
+
+class CleanupService:
+    """Deletes every entity still pending in a registry through a pooled client, with bounded concurrency.
+
+    Entities that are already gone (404) count as cleaned up; failures stay in the registry
+    so a later run of ``python -m utils.cleanup`` can retry them.
+    """
+
+    def __init__(self, client, registry, workers=8):
+        self.client = client
+        self.registry = registry
+        self.workers = workers
+        self.deleted = 0
+        self.missing = 0
+        self.failed = []
+        self.seconds = 0.0
+
+    # Returns "deleted", "missing" or the reason the delete failed
+    def _delete(self, entity):
+        kind, key = entity
+        try:
+            if kind == "pet":
+                response = self.client.delete_pet(key)
+            elif kind == "user":
+                response = self.client.delete_user(key)
+            else:
+                return f"don't know how to delete a '{kind}'"
+        except Exception as error:
+            return repr(error)
+        if response.status_code == 404:
+            self.registry.discard(kind, key)
+            return "missing"
+        return "deleted" if response.ok else f"HTTP {response.status_code}"
+
+    def run(self):
+        pending = self.registry.pending()
+        start = time.perf_counter()
+        if pending:
+            workers = max(1, min(self.workers, len(pending)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cleanup") as executor:
+                for entity, outcome in zip(pending, executor.map(self._delete, pending)):
+                    if outcome == "deleted":
+                        self.deleted += 1
+                    elif outcome == "missing":
+                        self.missing += 1
+                    else:
+                        self.failed.append((entity, outcome))
+        self.seconds = time.perf_counter() - start
+        return self
+
+    def as_dict(self):
+        return {
+            "deleted": self.deleted,
+            "missing": self.missing,
+            "failed": [[kind, key, reason] for (kind, key), reason in self.failed],
+            "seconds": self.seconds,
+            "workers": self.workers,
+        }
+
+    @classmethod
+    def combine(cls, results):
+        """One summary for the cleanups of several worker processes, from their as_dict() results."""
+        combined = cls(None, None, workers=max((result["workers"] for result in results), default=0))
+        for result in results:
+            combined.deleted += result["deleted"]
+            combined.missing += result["missing"]
+            combined.failed.extend(((kind, key), reason) for kind, key, reason in result["failed"])
+            combined.seconds = max(combined.seconds, result["seconds"])  # The workers clean up in parallel
+        return combined
+
+    def summary(self):
+        text = (
+            f"cleanup: {self.deleted} deleted, {self.missing} already gone, {len(self.failed)} failed "
+            f"in {self.seconds:.2f}s with {self.workers} worker(s)"
+        )
+        for (kind, key), reason in self.failed[:10]:
+            text += f"\n  could not delete {kind} {key}: {reason}"
+        return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Delete the users and pets recorded in a --data-registry file.")
+    parser.add_argument("--registry", required=True, help="JSONL file written by pytest --data-registry")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--workers", type=int, default=16, help="Maximum number of deletes in flight")
+    args = parser.parse_args(argv)
+
+    registry = EntityRegistry.load(args.registry)
+    with PetStoreClient(base_url=args.base_url, pool_size=args.workers, registry=registry) as client:
+        service = CleanupService(client, registry, args.workers).run()
+    print(service.summary())
+    return 1 if service.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
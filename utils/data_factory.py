@@ -0,0 +1,174 @@
+import copy
+import itertools
+import json
+import os
+import re
+import threading
+import time
+
+# Shared by the main process and its workers through the environment
+RUN_ID_ENV = "WEBSHOP_RUN_ID"
+
+# Run ids count tenths of a second and wrap after this many (about ten days), which keeps ids below 2**53
+RUN_ID_PERIOD = 9 * 10 ** 6
+
+# Top-level fields of a template that are made unique when it is expanded
+UNIQUE_FIELDS = ("id", "username", "email")
+
+
+def current_run_id():
+    """Id of this test run: its start time in tenths of a second, modulo RUN_ID_PERIOD.
+
+    Runs started at different moments within the period never share an id. Generated once
+    and inherited by worker processes.
+    """
+    if RUN_ID_ENV not in os.environ:
+        os.environ[RUN_ID_ENV] = str(int(time.time() * 10) % RUN_ID_PERIOD)
+    return os.environ[RUN_ID_ENV]
+
+
+def _base36(number):
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    text = ""
+    while number:
+        number, remainder = divmod(number, 36)
+        text = digits[remainder] + text
+    return text or "0"
+
+
+class EntityRegistry:
+    """Server-side entities created during a run, kept for cleanup.
+
+    With a path, every change is also appended to a JSONL file, so entities left behind by
+    earlier or crashed runs can be cleaned up in bulk later (see ``load``).
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entities = {}
+
+    def add(self, kind, key):
+        self._change(kind, key, created=True)
+
+    # The test deleted the entity itself; nothing left to clean up
+    def discard(self, kind, key):
+        self._change(kind, key, created=False)
+
+    def pending(self, kind=None):
+        """Entities still to clean up, as (kind, key) pairs in creation order."""
+        with self.lock:
+            return [entity for entity in self.entities if kind is None or entity[0] == kind]
+
+    @classmethod
+    def load(cls, path):
+        """Rebuilds the registry from a JSONL file written by earlier runs."""
+        registry = cls()
+        if os.path.exists(path):
+            with open(path) as file:
+                for line in file:
+                    if line.strip():
+                        record = json.loads(line)
+                        registry._apply(record["kind"], record["key"], record["created"])
+        registry.path = path
+        return registry
+
+    def _apply(self, kind, key, created):
+        if created:
+            self.entities[(kind, key)] = True
+        else:
+            self.entities.pop((kind, key), None)
+
+    def _change(self, kind, key, created):
+        with self.lock:
+            self._apply(kind, key, created)
+            if self.path:
+                with open(self.path, "a") as file:
+                    record = {"kind": kind, "key": key, "created": created, "runId": current_run_id(),
+                              "timestamp": time.time()}
+                    file.write(json.dumps(record) + "\n")
+
+
+class DataFactory:
+    """Expands test_data.json templates into records whose id, username and email are unique.
+
+    Uniqueness comes from the run id, the worker and a per-process counter, so concurrent
+    runs and parallel workers never create the same server-side record. Numeric ids stay
+    below 2**53 so they survive a round trip through JSON.
+    """
+
+    def __init__(self, templates, run_id=None, worker_id="main", registry=None):
+        self.templates = templates
+        self.run_id = run_id or current_run_id()
+        self.worker_id = worker_id
+        digits = re.sub(r"\D", "", worker_id)
+        self.worker_index = int(digits) + 1 if digits else 0  # 0 is the main process
+        self.registry = registry if registry is not None else EntityRegistry()
+        if not 0 <= int(self.run_id) < RUN_ID_PERIOD:
+            raise ValueError(f"Run id {self.run_id} is outside 0..{RUN_ID_PERIOD - 1}; ids would exceed 2**53")
+        # run id (< 9 * 10**6) followed by 3 worker digits and 6 counter digits stays below 9 * 10**15 < 2**53
+        self._id_base = int(self.run_id) * 10 ** 9 + self.worker_index * 10 ** 6
+        self._counter = itertools.count(1)
+        self._shared = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path="test_data.json", **kwargs):
+        with open(path) as file:
+            return cls(json.load(file), **kwargs)
+
+    def next_id(self):
+        count = next(self._counter)
+        if count >= 10 ** 6:
+            # Wrapping around would hand out ids this worker already used
+            raise RuntimeError(f"Data factory of worker {self.worker_id} ran out of unique ids (10**6 - 1 per run)")
+        return self._id_base + count
+
+    def template(self, name):
+        """Looks up a template by dotted path, e.g. "petStore.userCreationData"."""
+        value = self.templates
+        for part in name.split("."):
+            value = value[part]
+        return value
+
+    def expand(self, template):
+        """Returns a copy of a template (or of every template in a list) with unique fields."""
+        return self._make_unique(copy.deepcopy(template))
+
+    def _make_unique(self, record):
+        if isinstance(record, list):
+            return [self._make_unique(entry) for entry in record]
+        unique_id = self.next_id()
+        token = _base36(unique_id)
+        for field in UNIQUE_FIELDS:
+            if field not in record:
+                continue
+            value = record[field]
+            if field == "id":
+                record[field] = str(unique_id) if isinstance(value, str) else unique_id
+            elif field == "email":
+                local, _, domain = value.partition("@")
+                record[field] = f"{local}+{token}@{domain}"
+            else:
+                record[field] = f"{value}_{token}"
+        return record
+
+    def new(self, name):
+        """A fresh unique record (or list of records) from the named template."""
+        return self.expand(self.template(name))
+
+    def shared(self, name):
+        """The same unique record every time it is asked for in this process, e.g. for a chain of tests."""
+        with self._lock:
+            if name not in self._shared:
+                self._shared[name] = self.new(name)
+            return self._shared[name]
+
+    def batch(self, name, count):
+        """Pre-generates ``count`` unique records from the named template.
+
+        The template is serialised once and every record is parsed back from that string,
+        which is cheaper than deep-copying the template each time.
+        """
+        serialized = json.dumps(self.template(name))
+        return [self._make_unique(json.loads(serialized)) for _ in range(count)]
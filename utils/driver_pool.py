@@ -0,0 +1,145 @@
+import queue
+import threading
+import time
+from urllib.parse import urlparse
+
+from pages.base_page import BasePage
+from utils.elements import drop_element_cache
+
+SHOP_ORIGIN = "{0.scheme}://{0.netloc}".format(urlparse(BasePage.base_url))
+
+
+class DriverPool:
+    """Keeps a fixed number of browsers open for the whole session and hands them out per test."""
+
+    def __init__(self, factory, size=1, acquire_timeout=300):
+        if size < 1:
+            raise ValueError(f"Driver pool size must be at least 1, got {size}")
+        self.factory = factory
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self._idle = queue.LifoQueue()
+        self._drivers = []
+        self._lock = threading.Lock()
+
+        # Statistics used for the end-of-session report
+        self.launches = 0
+        self.launch_seconds = 0.0
+        self.checkouts = 0
+
+    # Hand out an idle browser, launching a new one while the pool is not full
+    def acquire(self):
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            driver = self._launch_or_wait()
+        self.checkouts += 1
+        return driver
+
+    # Return a browser to the pool after wiping the state left by the test
+    def release(self, driver):
+        try:
+            self.reset(driver)
+        except Exception:
+            # A browser that cannot be reset is not safe to reuse; a dead driver
+            # raises connection errors rather than WebDriverException
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    # Clear cookies and storage and park the browser on a blank page
+    @staticmethod
+    def reset(driver):
+        chrome = hasattr(driver, "execute_cdp_cmd")
+        url = driver.current_url
+        if not chrome and url.startswith("http") and not url.startswith(SHOP_ORIGIN):
+            # delete_all_cookies() and the storage script only reach the current origin; make that the shop
+            driver.get(BasePage.base_url)
+            url = driver.current_url
+        if url.startswith("http"):
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        if chrome:
+            # Cookies of every domain, and the shop's storage even when the test ended somewhere else
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                   {"origin": SHOP_ORIGIN, "storageTypes": "local_storage"})
+        else:
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    # Quit every browser owned by the pool
+    def close(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            drop_element_cache(driver)
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    @property
+    def average_launch_seconds(self):
+        return self.launch_seconds / self.launches if self.launches else 0.0
+
+    @property
+    def reuses(self):
+        return self.checkouts - self.launches
+
+    @property
+    def saved_seconds(self):
+        """Launch time avoided by reusing browsers instead of starting one per test."""
+        return self.reuses * self.average_launch_seconds
+
+    def summary(self):
+        return (
+            f"driver pool: {self.launches} browser launch(es) for {self.checkouts} test(s), "
+            f"avg launch {self.average_launch_seconds:.2f}s, saved ~{self.saved_seconds:.2f}s"
+        )
+
+    def _launch_or_wait(self):
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            with self._lock:
+                can_launch = len(self._drivers) < self.size
+                if can_launch:
+                    # Reserve the slot before the (slow) launch so concurrent callers respect the size
+                    self._drivers.append(None)
+            if can_launch:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"No browser became available within {self.acquire_timeout}s; "
+                    f"all {self.size} pooled browser(s) are still checked out"
+                )
+            # Check again now and then: a discarded browser frees a slot without returning to the idle queue
+            try:
+                return self._idle.get(timeout=min(remaining, 1.0))
+            except queue.Empty:
+                pass
+
+        start = time.perf_counter()
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._lock:
+                self._drivers.remove(None)
+            raise
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._drivers[self._drivers.index(None)] = driver
+            self.launches += 1
+            self.launch_seconds += elapsed
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        drop_element_cache(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
@@ -0,0 +1,152 @@
+from selenium.common.exceptions import StaleElementReferenceException
+
+from utils.reports import teardown_properties
+
+# One cache per browser (keyed by id), shared by every page object built on it. A cache keeps its
+# browser alive, so the id stays unique until drop_element_cache() removes the entry.
+_caches = {}
+
+
+class ElementCache:
+    """Elements resolved on the current page state, keyed by locator.
+
+    The page objects start a new page state after every navigation they make. A navigation
+    or re-render they do not know about leaves stale elements behind, which the element
+    handles notice on first use and resolve again.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._elements = {}
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def get(self, locator, refresh=False):
+        if not refresh and locator in self._elements:
+            self.hits += 1
+            return self._elements[locator]
+        self.misses += 1
+        element = self.driver.find_element(*locator)
+        self._elements[locator] = element
+        return element
+
+    def forget(self, locator):
+        self._elements.pop(locator, None)
+
+    # Drop every cached element, e.g. after a navigation
+    def invalidate(self):
+        self._elements.clear()
+
+    # Start over for a new test on a pooled browser
+    def reset(self):
+        self.invalidate()
+        self.hits = self.misses = self.stale = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "staleResolves": self.stale}
+
+
+def element_cache(driver):
+    cache = _caches.get(id(driver))
+    if cache is None:
+        cache = _caches[id(driver)] = ElementCache(driver)
+    return cache
+
+
+def drop_element_cache(driver):
+    """Forgets the cache of a browser that is being quit."""
+    _caches.pop(id(driver), None)
+
+
+class ElementHandle:
+    """Lazy reference to the element a locator points at.
+
+    Nothing is looked up until the handle is used; after that the element comes from the
+    cache. An operation that fails with StaleElementReferenceException is retried once on
+    a freshly resolved element, so callers never re-find elements themselves.
+    """
+
+    def __init__(self, cache, locator, waiter):
+        self.cache = cache
+        self.locator = locator
+        self.wait = waiter
+
+    def __repr__(self):
+        return f"ElementHandle{self.locator}"
+
+    def resolve(self):
+        return self.cache.get(self.locator)
+
+    def _run(self, operation):
+        try:
+            return operation(self.cache.get(self.locator))
+        except StaleElementReferenceException:
+            self.cache.stale += 1
+            return operation(self.cache.get(self.locator, refresh=True))
+
+    # Waits; each returns the handle once its element satisfies the check
+    def _until(self, check, description, timeout=None):
+        def condition(driver):
+            try:
+                return check(self.cache.get(self.locator))
+            except StaleElementReferenceException:
+                # Resolve again on the next poll; the wait engine ignores the exception
+                self.cache.stale += 1
+                self.cache.forget(self.locator)
+                raise
+
+        self.wait.until(condition, timeout, description=f"{description} {self.locator}")
+        return self
+
+    def present(self, timeout=None):
+        return self._until(lambda element: True, "present", timeout)
+
+    def visible(self, timeout=None):
+        return self._until(lambda element: element.is_displayed(), "visible", timeout)
+
+    def clickable(self, timeout=None):
+        return self._until(lambda element: element.is_displayed() and element.is_enabled(), "clickable", timeout)
+
+    def text_contains(self, text, timeout=None):
+        return self._until(lambda element: text in element.text, f"text '{text}' in", timeout)
+
+    # Operations on the element
+    @property
+    def text(self):
+        return self._run(lambda element: element.text)
+
+    def get_attribute(self, name):
+        return self._run(lambda element: element.get_attribute(name))
+
+    def is_displayed(self):
+        return self._run(lambda element: element.is_displayed())
+
+    def click(self):
+        self._run(lambda element: element.click())
+
+    def clear(self):
+        self._run(lambda element: element.clear())
+
+    def send_keys(self, *values):
+        self._run(lambda element: element.send_keys(*values))
+
+    # Run JavaScript with the element as arguments[0]
+    def execute_script(self, script, *args):
+        return self._run(lambda element: self.cache.driver.execute_script(script, element, *args))
+
+
+def summarize_cache_session(reports):
+    """Adds up the per-test "elementCache" user properties into one line, or None without UI tests."""
+    totals = {"hits": 0, "misses": 0, "staleResolves": 0}
+    tests = 0
+    for _, stats in teardown_properties(reports, "elementCache"):
+        tests += 1
+        for key, value in stats.items():
+            totals[key] += value
+    if not tests:
+        return None
+    return (
+        f"element cache: {totals['hits']} hit(s), {totals['misses']} miss(es), "
+        f"{totals['staleResolves']} stale element(s) resolved again over {tests} test(s)"
+    )
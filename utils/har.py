@@ -0,0 +1,207 @@
+import datetime
+import gzip
+import json
+import os
+import re
+from urllib.parse import parse_qsl, urlparse
+
+from utils.reports import teardown_properties
+
+# Number of requests listed per page and per category in the summaries
+TOP_REQUESTS = 5
+
+
+def _headers(headers):
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+# Header names are case-insensitive; DevTools reports them as the server sent them
+def _header(headers, name):
+    name = name.lower()
+    return next((str(value) for key, value in (headers or {}).items() if key.lower() == name), "")
+
+
+def _iso(wall_time):
+    return datetime.datetime.fromtimestamp(wall_time, datetime.timezone.utc).isoformat()
+
+
+def _timings(timing, total_ms):
+    """Splits a DevTools ResourceTiming into HAR phases; -1 marks a phase that did not happen."""
+    if not timing:
+        return {"blocked": -1, "dns": -1, "connect": -1, "ssl": -1, "send": 0, "wait": total_ms, "receive": 0}
+
+    def phase(start, end):
+        return timing[end] - timing[start] if timing.get(start, -1) >= 0 else -1
+
+    send_start = timing.get("sendStart", 0)
+    blocked = timing["dnsStart"] if timing.get("dnsStart", -1) >= 0 else send_start
+    connect = phase("connectStart", "connectEnd")
+    ssl = phase("sslStart", "sslEnd")
+    wait = timing.get("receiveHeadersEnd", send_start) - timing.get("sendEnd", send_start)
+    send = timing.get("sendEnd", send_start) - send_start
+    receive = max(0.0, total_ms - timing.get("receiveHeadersEnd", 0))
+    return {
+        "blocked": max(0.0, blocked),
+        "dns": phase("dnsStart", "dnsEnd"),
+        "connect": connect,
+        "ssl": ssl,  # HAR counts ssl inside connect as well
+        "send": max(0.0, send),
+        "wait": max(0.0, wait),
+        "receive": receive,
+    }
+
+
+def _response(response):
+    return {
+        "status": response.get("status", 0),
+        "statusText": response.get("statusText", ""),
+        "httpVersion": response.get("protocol", ""),
+        "cookies": [],
+        "headers": _headers(response.get("headers")),
+        "content": {"size": 0, "mimeType": response.get("mimeType", "")},
+        "redirectURL": _header(response.get("headers"), "location"),
+        "headersSize": -1,
+        "bodySize": -1,
+    }
+
+
+def build_har(events, creator="python-webshop-automation"):
+    """Turns the Network.* DevTools events of one test into a HAR 1.2 log.
+
+    Every top-level navigation opens a new page; the requests that follow, including the
+    hops of a redirected navigation, belong to it.
+    """
+    pages = []
+    entries = []
+    open_entries = {}
+    page_id = None
+
+    def finish(entry, timestamp):
+        entry["time"] = max(0.0, (timestamp - entry.pop("_startTimestamp")) * 1000)
+        entry["timings"] = _timings(entry.pop("_timing", None), entry["time"])
+        entries.append(entry)
+
+    for event in events:
+        method, params = event["method"], event["params"]
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            if "redirectResponse" in params and request_id in open_entries:
+                # Same request id, next hop: close the hop that was redirected
+                previous = open_entries.pop(request_id)
+                previous["response"] = _response(params["redirectResponse"])
+                previous["_timing"] = params["redirectResponse"].get("timing")
+                finish(previous, params["timestamp"])
+            request = params["request"]
+            # A navigation request carries its own loader id; its redirect hops stay on the same page
+            if (params.get("type") == "Document" and request_id == params.get("loaderId")
+                    and "redirectResponse" not in params):
+                path = urlparse(request["url"]).path or "/"
+                page_id = f"page_{len(pages) + 1}"
+                pages.append({
+                    "startedDateTime": _iso(params["wallTime"]),
+                    "id": page_id,
+                    "title": path,
+                    "pageTimings": {},
+                })
+            open_entries[request_id] = {
+                "pageref": page_id,
+                "startedDateTime": _iso(params["wallTime"]),
+                "request": {
+                    "method": request["method"],
+                    "url": request["url"],
+                    "httpVersion": "",
+                    "cookies": [],
+                    "headers": _headers(request.get("headers")),
+                    "queryString": [
+                        {"name": name, "value": value} for name, value in parse_qsl(urlparse(request["url"]).query)
+                    ],
+                    "headersSize": -1,
+                    "bodySize": len(request.get("postData", "")),
+                },
+                "response": _response({}),
+                "cache": {},
+                "_resourceType": params.get("type", "Other"),
+                "_startTimestamp": params["timestamp"],
+            }
+        elif request_id not in open_entries:
+            continue
+        elif method == "Network.responseReceived":
+            entry = open_entries[request_id]
+            entry["response"] = _response(params["response"])
+            entry["request"]["httpVersion"] = entry["response"]["httpVersion"]
+            entry["_timing"] = params["response"].get("timing")
+            entry["_fromCache"] = bool(params["response"].get("fromDiskCache"))
+        elif method == "Network.dataReceived":
+            content = open_entries[request_id]["response"]["content"]
+            content["size"] += params.get("dataLength", 0)
+        elif method == "Network.loadingFinished":
+            entry = open_entries.pop(request_id)
+            entry["response"]["bodySize"] = int(params.get("encodedDataLength", 0))
+            finish(entry, params["timestamp"])
+        elif method == "Network.loadingFailed":
+            entry = open_entries.pop(request_id)
+            entry["response"]["_error"] = params.get("blockedReason") or params.get("errorText", "")
+            finish(entry, params["timestamp"])
+
+    entries.sort(key=lambda entry: entry["startedDateTime"])
+    return {"log": {"version": "1.2", "creator": {"name": creator, "version": "1"}, "pages": pages, "entries": entries}}
+
+
+def har_file_name(nodeid):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid).strip("_") + ".har.gz"
+
+
+def write_har(har, directory, nodeid):
+    """Writes the HAR gzip-compressed as <directory>/<nodeid>.har.gz and returns the path."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, har_file_name(nodeid))
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        json.dump(har, file)
+    return path
+
+
+def summarize_pages(har, top=TOP_REQUESTS):
+    """Slowest and largest requests of every page, keyed by the page path."""
+    titles = {page["id"]: page["title"] for page in har["log"]["pages"]}
+    pages = {}
+    for entry in har["log"]["entries"]:
+        requests = pages.setdefault(titles.get(entry["pageref"], "(before first page)"), [])
+        requests.append({
+            "url": entry["request"]["url"],
+            "method": entry["request"]["method"],
+            "status": entry["response"]["status"],
+            "timeMs": round(entry["time"], 1),
+            "waitMs": round(entry["timings"]["wait"], 1),
+            "bytes": max(entry["response"]["bodySize"], entry["response"]["content"]["size"]),
+        })
+    return {
+        title: {
+            "requests": len(requests),
+            "slowest": sorted(requests, key=lambda request: -request["timeMs"])[:top],
+            "largest": sorted(requests, key=lambda request: -request["bytes"])[:top],
+        }
+        for title, requests in pages.items()
+    }
+
+
+def summarize_har_session(reports, top=TOP_REQUESTS):
+    """Merges the per-test "har" user properties into the slowest and largest requests of each page."""
+    pages = {}
+    for report, value in teardown_properties(reports, "har"):
+        for title, summary in value["pages"].items():
+            merged = pages.setdefault(title, {"slowest": [], "largest": []})
+            merged["slowest"].extend(dict(request, test=report.nodeid) for request in summary["slowest"])
+            merged["largest"].extend(dict(request, test=report.nodeid) for request in summary["largest"])
+    lines = []
+    for title, merged in sorted(pages.items()):
+        lines.append(f"{title}")
+        for request in sorted(merged["slowest"], key=lambda request: -request["timeMs"])[:top]:
+            lines.append(
+                f"  slow  {request['timeMs']:>8.1f} ms (wait {request['waitMs']:.1f})  "
+                f"{request['method']} {request['url']} [{request['status']}]"
+            )
+        for request in sorted(merged["largest"], key=lambda request: -request["bytes"])[:top]:
+            lines.append(
+                f"  large {request['bytes'] / 1024:>8.1f} KiB  {request['method']} {request['url']} [{request['status']}]"
+            )
+    return lines
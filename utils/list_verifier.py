@@ -0,0 +1,181 @@
+from collections import namedtuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.select import Select
+
+ProductRecord = namedtuple("ProductRecord", "product_id title price")
+GridSnapshot = namedtuple("GridSnapshot", "records sort_by page_size page")
+
+# Sort options of the listing pages: record key and whether the order is descending.
+# The grid shows no dates; product ids grow with creation, so "Created on" (newest first) is checked on them.
+SORT_ORDERS = {
+    "Position": None,
+    "Name: A to Z": (lambda record: record.title.lower(), False),
+    "Name: Z to A": (lambda record: record.title.lower(), True),
+    "Price: Low to High": (lambda record: record.price, False),
+    "Price: High to Low": (lambda record: record.price, True),
+    "Created on": (lambda record: record.product_id, True),
+}
+
+
+class ListVerifier:
+    """Snapshots a product grid once per state and checks sort, page size and pagination invariants on the snapshots.
+
+    A change (sort, page size, next page) is detected through a MutationObserver armed before the
+    change: the grid counts as settled once it has mutated and stayed quiet for ``quiet_ms``, or
+    once a new document has replaced the observed one. The settled check and the snapshot are the
+    same script call, so every poll either returns the complete grid or nothing.
+    """
+
+    # Start watching the element around the grid for changes
+    _arm_script = """
+        var container = document.querySelector(arguments[0]);
+        container = container ? container.parentNode : document.body;
+        if (window.__listVerifier) {
+            window.__listVerifier.observer.disconnect();
+        }
+        var state = {mutations: 0, lastMutation: 0};
+        state.observer = new MutationObserver(function (records) {
+            state.mutations += records.length;
+            state.lastMutation = performance.now();
+        });
+        state.observer.observe(container, {childList: true, subtree: true, characterData: true});
+        window.__listVerifier = state;
+    """
+
+    # Compact records of the settled grid, or null while the change is still in progress
+    _snapshot_script = """
+        var itemSelector = arguments[0], quietMs = arguments[1], armed = arguments[2];
+        var state = window.__listVerifier;
+        if (armed && state && (!state.mutations || performance.now() - state.lastMutation < quietMs)) {
+            return null;  // Same document, not changed yet or still changing
+        }
+        if (document.readyState === 'loading') {
+            return null;  // Replaced by a new document that is still loading
+        }
+        var boxes = document.querySelectorAll(itemSelector);
+        if (!boxes.length) {
+            return null;
+        }
+        if (state) {
+            state.observer.disconnect();
+            window.__listVerifier = null;
+        }
+        function text(root, selector) {
+            var element = root.querySelector(selector);
+            return element ? element.textContent.trim() : null;
+        }
+        function selected(selector) {
+            var select = document.querySelector(selector);
+            return select && select.selectedIndex >= 0 ? select.options[select.selectedIndex].text.trim() : null;
+        }
+        return {
+            records: Array.from(boxes).map(function (box) {
+                var item = box.matches('.product-item') ? box : box.querySelector('.product-item');
+                var price = text(box, '.actual-price');
+                return [
+                    item ? parseInt(item.getAttribute('data-productid'), 10) : null,
+                    text(box, '.product-title a'),
+                    price === null ? null : parseFloat(price.replace(/[^0-9.]/g, ''))
+                ];
+            }),
+            sortBy: selected(arguments[3]),
+            pageSize: selected(arguments[4]),
+            page: text(document, '.pager .current-page')
+        };
+    """
+
+    def __init__(self, driver, waiter, grid_selector=".product-grid", item_selector=".product-grid .item-box",
+                 sort_selector="#products-orderby", page_size_selector="#products-pagesize", quiet_ms=100):
+        self.driver = driver
+        self.wait = waiter
+        self.grid_selector = grid_selector
+        self.item_selector = item_selector
+        self.sort_selector = sort_selector
+        self.page_size_selector = page_size_selector
+        self.quiet_ms = quiet_ms
+        self.next_page = (By.CSS_SELECTOR, ".pager .next-page a")
+
+    def _poll_snapshot(self, armed, description):
+        data = self.wait.until(
+            lambda driver: driver.execute_script(
+                self._snapshot_script, self.item_selector, self.quiet_ms, armed,
+                self.sort_selector, self.page_size_selector
+            ),
+            description=description
+        )
+        page = int(data["page"]) if data["page"] and data["page"].isdigit() else 1
+        return GridSnapshot([ProductRecord(*record) for record in data["records"]], data["sortBy"],
+                            data["pageSize"], page)
+
+    # Snapshot the grid as it is now
+    def snapshot(self):
+        return self._poll_snapshot(False, f"grid snapshot {self.item_selector}")
+
+    # Run an action that changes the grid and snapshot it once it has settled
+    def change(self, action, description="grid change"):
+        self.driver.execute_script(self._arm_script, self.grid_selector)
+        action()
+        return self._poll_snapshot(True, description)
+
+    def _select(self, selector, visible_text):
+        Select(self.wait.clickable((By.CSS_SELECTOR, selector))).select_by_visible_text(visible_text)
+
+    def select_sort(self, visible_text):
+        return self.change(lambda: self._select(self.sort_selector, visible_text), f"sort by {visible_text}")
+
+    def select_page_size(self, visible_text):
+        return self.change(lambda: self._select(self.page_size_selector, visible_text), f"page size {visible_text}")
+
+    def has_next_page(self):
+        return bool(self.driver.find_elements(*self.next_page))
+
+    def go_to_next_page(self):
+        return self.change(lambda: self.wait.clickable(self.next_page).click(), "next page")
+
+    def walk_pages(self, first=None, max_pages=50):
+        """Snapshots of the current page and every following one."""
+        pages = [first or self.snapshot()]
+        while self.has_next_page() and len(pages) < max_pages:
+            pages.append(self.go_to_next_page())
+        return pages
+
+    # Invariants
+    @staticmethod
+    def check_sorted(snapshot, order):
+        if SORT_ORDERS.get(order) is None:
+            return
+        key, descending = SORT_ORDERS[order]
+        values = [key(record) for record in snapshot.records]
+        assert values == sorted(values, reverse=descending), f"Products are not sorted by '{order}': {values}"
+
+    @staticmethod
+    def check_complete(snapshot):
+        incomplete = [record for record in snapshot.records if None in record]
+        assert not incomplete, f"Product boxes without id, title or price: {incomplete}"
+
+    @staticmethod
+    def check_page_size(snapshot, page_size, total=None):
+        """A page holds ``page_size`` items, or all ``total`` items when there are fewer."""
+        count = len(snapshot.records)
+        if total is None:
+            assert count <= page_size, f"Expected at most {page_size} items, but got {count}"
+        else:
+            expected = min(page_size, total)
+            assert count == expected, f"Expected {expected} items, but got {count}"
+
+    @staticmethod
+    def check_pagination(pages, page_size):
+        """Every page is full except the last, pages are numbered in order and no product shows up twice."""
+        seen = set()
+        for index, snapshot in enumerate(pages):
+            count = len(snapshot.records)
+            if index < len(pages) - 1:
+                assert count == page_size, f"Page {snapshot.page} has {count} items, expected {page_size}"
+            else:
+                assert 0 < count <= page_size, f"Last page {snapshot.page} has {count} items"
+            assert snapshot.page == index + 1, f"Expected page {index + 1}, but the pager shows {snapshot.page}"
+            ids = [record.product_id for record in snapshot.records]
+            repeated = seen.intersection(ids)
+            assert not repeated, f"Products {sorted(repeated)} appear on more than one page"
+            seen.update(ids)
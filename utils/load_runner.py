@@ -0,0 +1,298 @@
+"""Replays the Pet Store API test flows as a load generator.
+
+Usage:
+    python -m utils.load_runner --duration 30 --concurrency 10
+    python -m utils.load_runner --duration 60 --rate 50 --flows user_creation,pet_lifecycle --json load.json
+    python -m utils.load_runner --stub --duration 5
+
+Every flow works on records generated by the DataFactory, unique to the run, and whatever the
+flows leave behind on the service is deleted by the CleanupService once the load stops.
+"""
+import argparse
+import itertools
+import json
+import math
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.api_client import BASE_URL, PetStoreClient
+from utils.cleanup import CleanupService
+from utils.data_factory import DataFactory
+from utils.petstore_stub import PetStoreStub
+
+# A scheduled flow that starts later than max(interval, this) counts as a late start
+LATE_START_SECONDS = 0.01
+
+# Path segments that are part of the route rather than a parameter
+STATIC_SEGMENTS = {"user", "pet", "login", "logout", "createWithList"}
+
+
+def endpoint_name(method, path):
+    """Collapses parameterised paths, e.g. GET /pet/123 becomes GET /pet/{id}."""
+    segments = [
+        segment if segment in STATIC_SEGMENTS else "{id}"
+        for segment in path.split("?")[0].strip("/").split("/")
+    ]
+    return f"{method} /" + "/".join(segments)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values), max(1, math.ceil(fraction * len(sorted_values)))) - 1
+    return sorted_values[rank]
+
+
+class LoadStats:
+    """Thread-safe per-endpoint latency and error bookkeeping."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.flow_errors = defaultdict(int)
+        self.dropped_flows = 0
+        self.late_starts = 0
+        self.started = None
+        self.finished = None
+
+    def record(self, endpoint, seconds, ok):
+        with self._lock:
+            self.latencies[endpoint].append(seconds)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def record_flow_error(self, flow):
+        with self._lock:
+            self.flow_errors[flow] += 1
+
+    def record_dropped(self):
+        with self._lock:
+            self.dropped_flows += 1
+
+    def record_late_start(self):
+        with self._lock:
+            self.late_starts += 1
+
+    def report(self):
+        elapsed = max((self.finished or time.perf_counter()) - self.started, 1e-9)
+        endpoints = {}
+        for endpoint, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            endpoints[endpoint] = {
+                "requests": len(values),
+                "errors": self.errors[endpoint],
+                "errorRate": self.errors[endpoint] / len(values),
+                "throughput": len(values) / elapsed,
+                "p50Ms": percentile(values, 0.50) * 1000,
+                "p95Ms": percentile(values, 0.95) * 1000,
+                "p99Ms": percentile(values, 0.99) * 1000,
+            }
+        return {
+            "durationSeconds": elapsed,
+            "endpoints": endpoints,
+            "flowErrors": dict(self.flow_errors),
+            "droppedFlows": self.dropped_flows,
+            "lateStarts": self.late_starts,
+        }
+
+
+class RecordingClient(PetStoreClient):
+    """PetStoreClient that times every request into a LoadStats instance."""
+
+    def __init__(self, stats, **kwargs):
+        super().__init__(**kwargs)
+        self.stats = stats
+        self._scheduled = threading.local()
+
+    # Open loop: charge the time a flow waited past its scheduled start to its first request
+    def schedule(self, scheduled_start):
+        self._scheduled.start = scheduled_start
+
+    def request(self, method, path, **kwargs):
+        endpoint = endpoint_name(method, path)
+        start = time.perf_counter()
+        scheduled_start = getattr(self._scheduled, "start", None)
+        if scheduled_start is not None:
+            self._scheduled.start = None
+            start = min(start, scheduled_start)
+        try:
+            response = super().request(method, path, **kwargs)
+        except Exception:
+            self.stats.record(endpoint, time.perf_counter() - start, ok=False)
+            raise
+        self.stats.record(endpoint, time.perf_counter() - start, ok=response.status_code < 400)
+        return response
+
+
+# Flows mirroring tests/test_api_pet_shop.py; every run of a flow works on its own records
+def flow_user_creation(client, factory):
+    user = factory.new("petStore.userCreationData")
+    client.create_user(user).raise_for_status()
+    client.get_user(user["username"]).raise_for_status()
+
+
+def flow_user_login_logout(client, factory):
+    user = factory.new("petStore.userCreationData")
+    client.create_user(user).raise_for_status()
+    client.login(user["username"], user["password"]).raise_for_status()
+    client.logout().raise_for_status()
+
+
+def flow_create_user_list(client, factory):
+    client.create_users_with_list(factory.new("petStore.userList")).raise_for_status()
+
+
+def flow_pet_lifecycle(client, factory):
+    pet = factory.new("petStore.petData")
+    client.add_pet(pet).raise_for_status()
+    client.update_pet({**pet, **factory.template("petStore.updatePetData")}).raise_for_status()
+    client.get_pet(pet["id"]).raise_for_status()
+    client.delete_pet(pet["id"]).raise_for_status()
+
+
+FLOWS = {
+    "user_creation": flow_user_creation,
+    "user_login_logout": flow_user_login_logout,
+    "create_user_list": flow_create_user_list,
+    "pet_lifecycle": flow_pet_lifecycle,
+}
+
+
+class LoadRunner:
+    """Runs the selected flows for a fixed duration, either closed-loop (concurrency) or open-loop (rate)."""
+
+    def __init__(self, client, factory, flows, duration, concurrency=1, rate=None):
+        self.client = client
+        self.factory = factory
+        self.flows = [(name, FLOWS[name]) for name in flows]
+        self.duration = duration
+        self.concurrency = concurrency
+        self.rate = rate
+        self._iterations = itertools.count()
+        self._deadline = None
+
+    def run(self):
+        stats = self.client.stats
+        stats.started = time.perf_counter()
+        self._deadline = stats.started + self.duration
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            if self.rate:
+                self._run_at_rate(executor)
+            else:
+                for _ in range(self.concurrency):
+                    executor.submit(self._virtual_user)
+        stats.finished = time.perf_counter()
+        return stats.report()
+
+    def _run_once(self, scheduled_start=None):
+        if scheduled_start is not None and not self._start_scheduled(scheduled_start):
+            return
+        iteration = next(self._iterations)
+        name, flow = self.flows[iteration % len(self.flows)]
+        try:
+            flow(self.client, self.factory)
+        except Exception:
+            self.client.stats.record_flow_error(name)
+
+    # Closed loop: every virtual user starts its next flow as soon as the previous one ends
+    def _virtual_user(self):
+        while time.perf_counter() < self._deadline:
+            self._run_once()
+
+    # Open loop: start flows on a fixed schedule regardless of how long they take
+    def _run_at_rate(self, executor):
+        interval = 1.0 / self.rate
+        next_start = time.perf_counter()
+        while next_start < self._deadline:
+            delay = next_start - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(self._run_once, next_start)
+            next_start += interval
+
+    def _start_scheduled(self, scheduled_start):
+        """Drops a flow the pool could not start before the deadline; otherwise times it from its schedule.
+
+        Latency is measured from the scheduled start, not from when a worker picked the flow up,
+        so time spent queued behind a saturated pool shows in the percentiles.
+        """
+        stats = self.client.stats
+        now = time.perf_counter()
+        if now >= self._deadline:
+            stats.record_dropped()
+            return False
+        if now - scheduled_start > max(1.0 / self.rate, LATE_START_SECONDS):
+            stats.record_late_start()
+        self.client.schedule(scheduled_start)
+        return True
+
+
+def format_report(report):
+    lines = [
+        f"{'endpoint':32} {'reqs':>7} {'err%':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    ]
+    for endpoint, row in report["endpoints"].items():
+        lines.append(
+            f"{endpoint:32} {row['requests']:>7} {row['errorRate'] * 100:>5.1f}% {row['throughput']:>8.1f} "
+            f"{row['p50Ms']:>8.1f} {row['p95Ms']:>8.1f} {row['p99Ms']:>8.1f}"
+        )
+    for flow, count in report["flowErrors"].items():
+        lines.append(f"flow '{flow}' failed {count} time(s)")
+    if report["droppedFlows"] or report["lateStarts"]:
+        lines.append(
+            f"open loop fell behind: {report['droppedFlows']} flow(s) dropped at the deadline, "
+            f"{report['lateStarts']} started late (raise --concurrency or lower --rate)"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay the Pet Store API flows as load.")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--stub", action="store_true", help="Run against the bundled in-memory Pet Store")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to generate load for")
+    parser.add_argument("--concurrency", type=int, default=10, help="Virtual users / maximum in-flight flows")
+    parser.add_argument("--rate", type=float, help="Flows started per second (open loop) instead of closed loop")
+    parser.add_argument("--flows", default=",".join(FLOWS), help=f"Comma separated subset of: {', '.join(FLOWS)}")
+    parser.add_argument("--data", default="test_data.json")
+    parser.add_argument("--cleanup-workers", type=int, default=8,
+                        help="Concurrent deletes used to remove the users and pets the flows created; 0 keeps them")
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    flows = [name.strip() for name in args.flows.split(",") if name.strip()]
+    unknown = [name for name in flows if name not in FLOWS]
+    if unknown:
+        parser.error(f"Unknown flow(s): {', '.join(unknown)}")
+
+    factory = DataFactory.from_file(args.data, worker_id="load")
+    stub = PetStoreStub().start() if args.stub else None
+    base_url = stub.base_url if stub else args.base_url
+    cleanup = None
+    try:
+        with RecordingClient(LoadStats(), base_url=base_url, pool_size=args.concurrency, retries=0,
+                             registry=factory.registry) as client:
+            report = LoadRunner(client, factory, flows, args.duration, args.concurrency, args.rate).run()
+            if args.cleanup_workers > 0:
+                cleanup = CleanupService(client, factory.registry, args.cleanup_workers).run()
+    finally:
+        if stub:
+            stub.stop()
+
+    print(format_report(report))
+    if cleanup is not None:
+        print(cleanup.summary())
+    if args.json_path:
+        with open(args.json_path, "w") as file:
+            json.dump(report, file, indent=2)
+    failed = any(row["errors"] for row in report["endpoints"].values())
+    return 1 if failed or report["droppedFlows"] or report["lateStarts"] or (cleanup and cleanup.failed) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
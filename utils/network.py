@@ -0,0 +1,135 @@
+import json
+import os
+
+from utils.har import build_har, summarize_pages, write_har
+from utils.reports import teardown_properties
+
+# URL patterns (Network.setBlockedURLs wildcard syntax) for each resource class that can be blocked
+RESOURCE_CLASSES = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav"],
+    "third-party": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*facebook.net*", "*facebook.com/tr*", "*hotjar.com*", "*addthis.com*",
+    ],
+}
+
+
+def parse_resource_classes(value):
+    """Turns a comma separated --block-resources value into a list of known classes."""
+    classes = [name.strip() for name in (value or "").split(",") if name.strip()]
+    unknown = [name for name in classes if name not in RESOURCE_CLASSES]
+    if unknown:
+        raise ValueError(f"Unknown resource class(es) {unknown}, choose from {sorted(RESOURCE_CLASSES)}")
+    return classes
+
+
+def drain_network_events(driver):
+    """Reads (and empties) the browser performance log, keeping only the Network.* DevTools events."""
+    events = []
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message["method"].startswith("Network."):
+            events.append(message)
+    return events
+
+
+def summarize_network_events(events):
+    """Counts requests and bytes, and how many of them blocking or the cache saved."""
+    requests = set()
+    blocked = set()
+    cached = set()
+    received = {}
+    transferred_bytes = 0
+    for event in events:
+        method, params = event["method"], event["params"]
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            requests.add(request_id)
+        elif method == "Network.requestServedFromCache":
+            cached.add(request_id)
+        elif method == "Network.responseReceived":
+            response = params["response"]
+            if response.get("fromDiskCache") or response.get("fromPrefetchCache"):
+                cached.add(request_id)
+        elif method == "Network.dataReceived":
+            received[request_id] = received.get(request_id, 0) + params.get("dataLength", 0)
+        elif method == "Network.loadingFinished":
+            transferred_bytes += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            blocked.add(request_id)
+    return {
+        "requests": len(requests),
+        "transferredBytes": transferred_bytes,
+        "blockedRequests": len(blocked),
+        "cachedRequests": len(cached),
+        "cachedBytes": sum(received.get(request_id, 0) for request_id in cached),
+    }
+
+
+class NetworkOptimizer:
+    """Chrome-only resource blocking and persistent asset cache, with per-test savings.
+
+    Blocking uses the DevTools Network.setBlockedURLs command. Static assets are kept in a
+    browser disk cache directory that outlives every browser, so later tests and later
+    sessions load them from disk instead of the network. Chrome's disk cache cannot be shared
+    by browsers running at the same time, so every browser gets its own subdirectory, named
+    after the worker and the browser's launch number there. With ``har_dir`` every test's
+    requests are also written there as a gzip-compressed HAR file.
+    """
+
+    def __init__(self, block=(), cache_dir=None, har_dir=None):
+        self.block = list(block)
+        self.patterns = [pattern for name in self.block for pattern in RESOURCE_CLASSES[name]]
+        self.cache_dir = os.path.abspath(cache_dir) if cache_dir else None
+        self.har_dir = har_dir
+        self.launches = 0
+
+    # Launch options; must be applied before the browser starts
+    def configure_chrome(self, options):
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        if self.cache_dir:
+            from utils.parallel import get_worker_id  # Plugin module: imported late so pytest registers it first
+            # Launch numbers are never reused in a process, so a browser relaunched after a
+            # discarded one never shares a directory with a browser that is still running
+            cache_dir = os.path.join(self.cache_dir, f"{get_worker_id()}-{self.launches}")
+            self.launches += 1
+            os.makedirs(cache_dir, exist_ok=True)
+            options.add_argument(f"--disk-cache-dir={cache_dir}")
+
+    # DevTools settings; applied once per launched browser
+    def attach(self, driver):
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        if self.patterns:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+
+    def start_test(self, driver):
+        drain_network_events(driver)  # Drop whatever the previous test left in the log
+
+    # Per-test measurements as (name, value) user properties
+    def finish_test(self, driver, nodeid):
+        events = drain_network_events(driver)
+        properties = [("network", summarize_network_events(events))]
+        if self.har_dir:
+            har = build_har(events)
+            properties.append(("har", {"path": write_har(har, self.har_dir, nodeid), "pages": summarize_pages(har)}))
+        return properties
+
+
+def summarize_session(reports):
+    """Adds up the per-test "network" user properties; works for in-process and worker reports alike."""
+    totals = {}
+    tests = 0
+    for _, stats in teardown_properties(reports, "network"):
+        tests += 1
+        for key, value in stats.items():
+            totals[key] = totals.get(key, 0) + value
+    if not tests:
+        return None
+    return (
+        f"network: {totals['requests']} request(s) over {tests} test(s), "
+        f"{totals['blockedRequests']} blocked, {totals['cachedRequests']} served from cache "
+        f"({totals['cachedBytes'] / 1024:.0f} KiB not downloaded)"
+    )
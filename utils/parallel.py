@@ -0,0 +1,203 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+WORKER_ID_ENV = "WEBSHOP_WORKER_ID"
+WORKER_TESTS_ENV = "WEBSHOP_WORKER_TESTS"
+WORKER_REPORTS_ENV = "WEBSHOP_WORKER_REPORTS"
+WORKER_RESULTS_ENV = "WEBSHOP_WORKER_RESULTS"
+
+# Estimated seconds per nodeid, filled in by the scheduler when it has history
+estimated_durations_key = pytest.StashKey[dict]()
+
+# (name, value) pairs the workers sent with send_to_main, collected by the main process
+worker_results_key = pytest.StashKey[list]()
+
+
+def get_worker_id():
+    """Returns the id of the current worker process, or "main" when not running in parallel."""
+    return os.environ.get(WORKER_ID_ENV, "main")
+
+
+def is_worker():
+    return WORKER_ID_ENV in os.environ
+
+
+def send_to_main(name, value):
+    """From a worker, hands a JSON value to the main process; returns False when not running in a worker.
+
+    For results that belong to the session rather than to a test report, e.g. what session
+    fixtures did in their teardown.
+    """
+    results_file = os.environ.get(WORKER_RESULTS_ENV)
+    if not results_file:
+        return False
+    with open(results_file, "a") as file:
+        file.write(json.dumps({"name": name, "value": value}) + "\n")
+    return True
+
+
+def worker_results(config, name):
+    """Values the workers sent under ``name``, in the main process."""
+    return [value for result_name, value in config.stash.get(worker_results_key, []) if result_name == name]
+
+
+# Split collected items into groups that must stay together on a single worker:
+# one group per dependency chain, one for all serial tests, and every other test on its own
+def group_items(items):
+    groups = []
+    shared = {}
+    for item in items:
+        chain = item.get_closest_marker("chain")
+        if chain:
+            key = ("chain", chain.args[0])
+        elif item.get_closest_marker("serial"):
+            key = ("serial",)
+        else:
+            groups.append([item])
+            continue
+        if key not in shared:
+            shared[key] = []
+            groups.append(shared[key])
+        shared[key].append(item)
+    return groups
+
+
+# Deal the groups out to the workers, longest first, always filling the least loaded one
+def partition(items, workers, durations=None):
+    """Longest-processing-time-first packing of the groups onto ``workers`` buckets.
+
+    ``durations`` maps node ids to estimated seconds; without it every test counts as one unit.
+    Inside every bucket the tests keep the order they have in ``items``.
+    """
+    def cost(group):
+        return sum(durations.get(item.nodeid, 1.0) for item in group) if durations else len(group)
+
+    buckets = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for group in sorted(group_items(items), key=cost, reverse=True):
+        index = loads.index(min(loads))
+        buckets[index].extend(group)
+        loads[index] += cost(group)
+
+    position = {item.nodeid: index for index, item in enumerate(items)}
+    return [sorted(bucket, key=lambda item: position[item.nodeid]) for bucket in buckets if bucket]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--workers", action="store", type=int, default=1,
+        help="Number of worker processes to spread the tests over, each with its own browser"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Inside a worker, only keep the tests the main process assigned to it."""
+    tests_file = os.environ.get(WORKER_TESTS_ENV)
+    if not tests_file:
+        return
+    with open(tests_file) as file:
+        assigned = json.load(file)
+    order = {nodeid: index for index, nodeid in enumerate(assigned)}
+
+    selected = sorted((item for item in items if item.nodeid in order), key=lambda item: order[item.nodeid])
+    deselected = [item for item in items if item.nodeid not in order]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+class WorkerReporter:
+    """Forwards every test report of a worker process to the main process through a JSONL file."""
+
+    def __init__(self, config, reports_file):
+        self.config = config
+        self.reports_file = reports_file
+
+    def pytest_runtest_logreport(self, report):
+        data = self.config.hook.pytest_report_to_serializable(config=self.config, report=report)
+        with open(self.reports_file, "a") as file:
+            file.write(json.dumps(data) + "\n")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "serial: run the marked tests on a single worker, in file order")
+    reports_file = os.environ.get(WORKER_REPORTS_ENV)
+    if reports_file:
+        config.pluginmanager.register(WorkerReporter(config, reports_file), "webshop-worker-reporter")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    """In the main process, run the collected tests in worker subprocesses instead of in-process."""
+    config = session.config
+    workers = config.getoption("--workers")
+    if workers <= 1 or is_worker() or config.option.collectonly or not session.items:
+        return None
+
+    buckets = partition(session.items, workers, config.stash.get(estimated_durations_key, None))
+    workdir = tempfile.mkdtemp(prefix="webshop-workers-")
+    processes = []
+    for index, bucket in enumerate(buckets):
+        worker_id = f"gw{index}"
+        tests_file = os.path.join(workdir, f"{worker_id}.tests.json")
+        reports_file = os.path.join(workdir, f"{worker_id}.reports.jsonl")
+        results_file = os.path.join(workdir, f"{worker_id}.results.jsonl")
+        log_file = os.path.join(workdir, f"{worker_id}.log")
+        with open(tests_file, "w") as file:
+            json.dump([item.nodeid for item in bucket], file)
+
+        env = dict(os.environ, **{
+            WORKER_ID_ENV: worker_id,
+            WORKER_TESTS_ENV: tests_file,
+            WORKER_REPORTS_ENV: reports_file,
+            WORKER_RESULTS_ENV: results_file,
+        })
+        # --lf/--ff/--nf/--sw were applied by the main process; workers get an empty cache of their own so those
+        # options still parse but select nothing further, and the project's .pytest_cache stays untouched
+        cache_dir = os.path.join(workdir, f"{worker_id}.cache")
+        args = [sys.executable, "-m", "pytest", *config.invocation_params.args, "-o", f"cache_dir={cache_dir}", "-q"]
+        with open(log_file, "w") as log:
+            process = subprocess.Popen(args, cwd=config.invocation_params.dir, env=env, stdout=log,
+                                       stderr=subprocess.STDOUT)
+        processes.append((worker_id, process, reports_file, results_file, log_file))
+
+    config.stash[worker_results_key] = []
+    for worker_id, process, reports_file, results_file, log_file in processes:
+        returncode = process.wait()
+        _replay_reports(config, reports_file)
+        _collect_results(config, results_file)
+        # 0: passed, 1: some tests failed, 5: nothing selected; anything else means the worker broke
+        if returncode not in (0, 1, 5):
+            session.testsfailed += 1
+            with open(log_file) as log:
+                config.get_terminal_writer().line(
+                    f"worker {worker_id} exited with code {returncode}:\n{log.read()}", red=True
+                )
+    return True
+
+
+def _collect_results(config, results_file):
+    if not os.path.exists(results_file):
+        return
+    with open(results_file) as file:
+        for line in file:
+            result = json.loads(line)
+            config.stash[worker_results_key].append((result["name"], result["value"]))
+
+
+def _replay_reports(config, reports_file):
+    if not os.path.exists(reports_file):
+        return
+    with open(reports_file) as file:
+        for line in file:
+            report = config.hook.pytest_report_from_serializable(config=config, data=json.loads(line))
+            if report.when == "setup":
+                config.hook.pytest_runtest_logstart(nodeid=report.nodeid, location=report.location)
+            config.hook.pytest_runtest_logreport(report=report)
+            if report.when == "teardown":
+                config.hook.pytest_runtest_logfinish(nodeid=report.nodeid, location=report.location)
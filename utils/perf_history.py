@@ -0,0 +1,137 @@
+import json
+import os
+import statistics
+import time
+import uuid
+
+import pytest
+
+from utils.parallel import is_worker
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Scale factor that makes the MAD comparable to a standard deviation for normally distributed data
+MAD_SCALE = 1.4826
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf-history", "performance baseline")
+    group.addoption(
+        "--perf-history", action="store", default=None, metavar="PATH",
+        help="JSONL file that every run's test durations are appended to and compared against"
+    )
+    group.addoption(
+        "--perf-window", action="store", type=int, default=20,
+        help="Number of previous runs that make up the rolling baseline of a test"
+    )
+    group.addoption(
+        "--perf-min-runs", action="store", type=int, default=5,
+        help="Minimum number of previous runs before a test is compared"
+    )
+    group.addoption(
+        "--perf-threshold", action="store", type=float, default=3.0,
+        help="Robust z-score (in scaled MADs above the median) that counts as a regression"
+    )
+    group.addoption(
+        "--perf-min-increase", action="store", type=float, default=0.2,
+        help="Minimum relative slow-down over the median that counts as a regression (0.2 = 20%%)"
+    )
+    group.addoption(
+        "--perf-fail", action="store_true", default=False,
+        help="Fail the run when a test regressed instead of only reporting it"
+    )
+
+
+def pytest_configure(config):
+    path = config.getoption("--perf-history")
+    if path and not is_worker():
+        config.pluginmanager.register(PerformanceHistory(config, path), "webshop-perf-history")
+
+
+def stable_nodeid(config, nodeid):
+    """Node id relative to the project root.
+
+    pytest's own node ids are relative to the rootdir, which moves when an existing file is
+    passed as an option value (for example this plugin's history file).
+    """
+    path, separator, rest = nodeid.partition("::")
+    absolute = os.path.join(str(config.rootpath), path)
+    return os.path.relpath(absolute, PROJECT_ROOT).replace(os.sep, "/") + separator + rest
+
+
+def load_history(path):
+    """Returns {nodeid: [seconds, ...]} in run order."""
+    history = {}
+    if not os.path.exists(path):
+        return history
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                history.setdefault(record["nodeid"], []).append(record["seconds"])
+    return history
+
+
+def detect_regression(seconds, previous, threshold, min_increase):
+    """Compares a duration with the median/MAD of the previous ones; returns the details or None."""
+    median = statistics.median(previous)
+    mad = statistics.median(abs(value - median) for value in previous) * MAD_SCALE
+    increase = (seconds - median) / median if median else 0.0
+    # A zero MAD (identical durations) would make any change infinite, so rely on the relative check alone
+    z_score = (seconds - median) / mad if mad else float("inf") if seconds > median else 0.0
+    if z_score > threshold and increase > min_increase:
+        return {"seconds": seconds, "median": median, "mad": mad, "zScore": z_score, "increase": increase}
+    return None
+
+
+class PerformanceHistory:
+    """Appends each run's test durations to a JSONL store and flags tests slower than their rolling baseline."""
+
+    def __init__(self, config, path):
+        self.config = config
+        self.path = path
+        self.durations = {}
+        self.regressions = {}
+
+    def pytest_runtest_logreport(self, report):
+        # Only passed test bodies: failures and setup noise (browser launches) would skew the baseline
+        if report.when == "call" and report.passed:
+            self.durations[stable_nodeid(self.config, report.nodeid)] = report.duration
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session):
+        config = self.config
+        history = load_history(self.path)
+        window = config.getoption("--perf-window")
+        for nodeid, seconds in self.durations.items():
+            previous = history.get(nodeid, [])[-window:]
+            if len(previous) < config.getoption("--perf-min-runs"):
+                continue
+            regression = detect_regression(
+                seconds, previous, config.getoption("--perf-threshold"), config.getoption("--perf-min-increase")
+            )
+            if regression:
+                self.regressions[nodeid] = regression
+
+        self._append_run()
+        if self.regressions and config.getoption("--perf-fail") and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.regressions:
+            return
+        terminalreporter.section("performance regressions", red=True)
+        for nodeid, regression in sorted(self.regressions.items(), key=lambda item: -item[1]["increase"]):
+            terminalreporter.write_line(
+                f"{nodeid}: {regression['seconds']:.3f}s vs median {regression['median']:.3f}s "
+                f"(+{regression['increase'] * 100:.0f}%, z={regression['zScore']:.1f})"
+            )
+
+    def _append_run(self):
+        run_id = uuid.uuid4().hex
+        timestamp = time.time()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a") as file:
+            for nodeid, seconds in self.durations.items():
+                file.write(json.dumps({"runId": run_id, "timestamp": timestamp, "nodeid": nodeid, "seconds": seconds}) + "\n")
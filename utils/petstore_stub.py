@@ -0,0 +1,226 @@
+"""In-memory stand-in for the Swagger Pet Store endpoints used by the API suite.
+
+Usage:
+    python -m utils.petstore_stub --port 8080
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlparse
+
+from utils.background_server import BackgroundServer
+
+
+def _coerce_id(value):
+    """The real service stores ids as integers even when they are sent as strings."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class PetStoreState:
+    """Users and pets kept in memory, guarded by a single lock."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = {}
+        self.pets = {}
+
+    def reset(self):
+        with self.lock:
+            self.users.clear()
+            self.pets.clear()
+
+
+class PetStoreHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real service
+    disable_nagle_algorithm = True  # Headers and body are written separately; do not hold the body back
+    state = None  # Set per server by PetStoreStub
+
+    # Routing
+    def do_GET(self):
+        path, query = self._route()
+        if path == ["user", "login"]:
+            if not query.get("username") or not query.get("password"):
+                return self._send(400, self._error("Invalid username/password supplied", code=400))
+            return self._send(200, self._api_message(f"logged in user session:{int(time.time() * 1000)}"),
+                              headers={"X-Rate-Limit": "5000", "X-Expires-After": str(int(time.time()) + 3600)})
+        if path == ["user", "logout"]:
+            return self._send(200, self._api_message("ok"))
+        if len(path) == 2 and path[0] == "user":
+            with self.state.lock:
+                user = self.state.users.get(path[1])
+            if user is None:
+                return self._send(404, self._error("User not found"))
+            return self._send(200, user)
+        if len(path) == 2 and path[0] == "pet":
+            with self.state.lock:
+                pet = self.state.pets.get(_coerce_id(path[1]))
+            if pet is None:
+                return self._send(404, self._error("Pet not found"))
+            return self._send(200, pet)
+        self._not_found()
+
+    def do_POST(self):
+        path, _ = self._route()
+        body = self._read_json()
+        if body is None:
+            return
+        if path == ["user"]:
+            if not self._is_user(body):
+                return self._bad_input()
+            user = self._store_user(body)
+            return self._send(200, self._api_message(str(user["id"])))
+        if path in (["user", "createWithList"], ["user", "createWithArray"]):
+            # All or nothing: a list with one malformed user stores none of them
+            if not isinstance(body, list) or not all(self._is_user(user) for user in body):
+                return self._bad_input()
+            for user in body:
+                self._store_user(user)
+            return self._send(200, self._api_message("ok"))
+        if path == ["pet"]:
+            if not self._is_pet(body):
+                return self._invalid_pet()
+            return self._send(200, self._store_pet(body))
+        self._not_found()
+
+    def do_PUT(self):
+        path, _ = self._route()
+        body = self._read_json()
+        if body is None:
+            return
+        if path == ["pet"]:
+            if not self._is_pet(body):
+                return self._invalid_pet()
+            return self._send(200, self._store_pet(body))
+        if len(path) == 2 and path[0] == "user":
+            if not self._is_user(body):
+                return self._bad_input()
+            with self.state.lock:
+                self.state.users.pop(path[1], None)
+            user = self._store_user(body)
+            return self._send(200, self._api_message(str(user["id"])))
+        self._not_found()
+
+    def do_DELETE(self):
+        path, _ = self._route()
+        if len(path) == 2 and path[0] in ("pet", "user"):
+            with self.state.lock:
+                if path[0] == "pet":
+                    removed = self.state.pets.pop(_coerce_id(path[1]), None)
+                else:
+                    removed = self.state.users.pop(path[1], None)
+            if removed is None:
+                return self._send(404, None)
+            return self._send(200, self._api_message(path[1]))
+        self._not_found()
+
+    # Storage helpers
+    # Ids are stored as dict keys, so an object or array id is malformed input
+    @staticmethod
+    def _has_scalar_id(record):
+        return not isinstance(record.get("id"), (dict, list))
+
+    @classmethod
+    def _is_user(cls, user):
+        return (isinstance(user, dict) and isinstance(user.get("username"), str) and bool(user["username"])
+                and cls._has_scalar_id(user))
+
+    @classmethod
+    def _is_pet(cls, pet):
+        return isinstance(pet, dict) and cls._has_scalar_id(pet)
+
+    def _store_user(self, user):
+        user = {**user, "id": _coerce_id(user.get("id", 0))}
+        with self.state.lock:
+            self.state.users[user["username"]] = user
+        return user
+
+    def _store_pet(self, pet):
+        pet = {"photoUrls": [], "tags": [], **pet, "id": _coerce_id(pet.get("id", 0))}
+        with self.state.lock:
+            self.state.pets[pet["id"]] = pet
+        return pet
+
+    # Request / response helpers
+    def _route(self):
+        url = urlparse(self.path)
+        path = [segment for segment in url.path.split("/") if segment]
+        if path[:1] == ["v2"]:
+            path = path[1:]
+        return path, parse_qs(url.query)
+
+    def _read_json(self):
+        """The parsed body, or None after answering 400 to an empty or malformed one."""
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"null")
+        except ValueError:
+            body = None
+        if body is None:
+            self._bad_input()
+        return body
+
+    def _bad_input(self):
+        self._send(400, self._error("bad input", code=400))
+
+    def _invalid_pet(self):
+        self._send(405, self._error("Invalid input", code=405))
+
+    def _not_found(self):
+        self._send(404, self._error("Not found", code=404))
+
+    @staticmethod
+    def _api_message(message, code=200):
+        return {"code": code, "type": "unknown", "message": message}
+
+    @staticmethod
+    def _error(message, code=1):
+        return {"code": code, "type": "error", "message": message}
+
+    def _send(self, status, payload, headers=None):
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep test output clean
+
+
+class PetStoreStub(BackgroundServer):
+    """Runs the Pet Store stand-in on a background thread; use as a context manager or start()/stop()."""
+
+    base_path = "/v2"
+    thread_name = "petstore-stub"
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.state = PetStoreState()
+        super().__init__(type("BoundPetStoreHandler", (PetStoreHandler,), {"state": self.state}), host, port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve an in-memory Pet Store stand-in.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args(argv)
+
+    stub = PetStoreStub(args.host, args.port)
+    print(f"Pet Store stub listening on {stub.base_url}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+def teardown_properties(reports, name):
+    """Yields (report, value) for every user property called ``name`` in the teardown reports.
+
+    Fixtures add their per-test measurements after the test ran, so they only reach the
+    teardown report; that holds for reports replayed from worker processes as well.
+    """
+    for report in reports:
+        if getattr(report, "when", None) != "teardown":
+            continue
+        for property_name, value in report.user_properties:
+            if property_name == name:
+                yield report, value
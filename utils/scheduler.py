@@ -0,0 +1,132 @@
+import statistics
+
+import pytest
+
+from utils.parallel import estimated_durations_key, group_items, is_worker
+
+CACHE_KEY = "webshop/test-stats"
+
+# Weight of the latest run in the moving averages of duration and failure rate
+SMOOTHING = 0.3
+
+# Failure rate assumed for a test without history: new tests are as likely to fail as not
+NEW_TEST_FAILURE_RATE = 0.5
+
+# Duration assumed when nothing at all is known about the suite
+DEFAULT_SECONDS = 1.0
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--schedule", action="store", choices=("file", "smart"), default="file",
+        help="Test order: 'file' keeps collection order; 'smart' runs likely failures and cheap tests "
+             "first, based on the durations and outcomes of previous runs"
+    )
+
+
+def pytest_configure(config):
+    # Workers run the order the main process gave them, and have no cache of their own
+    if not is_worker() and hasattr(config, "cache"):
+        config.pluginmanager.register(Scheduler(config), "webshop-scheduler")
+
+
+def update_stats(stats, seconds, failed):
+    """Folds one run of a test into its history entry."""
+    if not stats:
+        return {"runs": 1, "failures": int(failed), "flips": 0, "seconds": seconds,
+                "failureRate": float(failed), "lastFailed": failed}
+    return {
+        "runs": stats["runs"] + 1,
+        "failures": stats["failures"] + int(failed),
+        # An outcome that keeps changing between runs is what flakiness looks like
+        "flips": stats["flips"] + int(failed != stats["lastFailed"]),
+        "seconds": SMOOTHING * seconds + (1 - SMOOTHING) * stats["seconds"],
+        "failureRate": SMOOTHING * float(failed) + (1 - SMOOTHING) * stats["failureRate"],
+        "lastFailed": failed,
+    }
+
+
+def flakiness(stats):
+    """Share of consecutive runs whose outcome differed."""
+    return stats["flips"] / (stats["runs"] - 1) if stats["runs"] > 1 else 0.0
+
+
+def failure_probability(stats):
+    """Recent failure rate, never quite zero so that among passing tests the cheap ones still go first."""
+    if not stats:
+        return NEW_TEST_FAILURE_RATE
+    return max(stats["failureRate"], 1 / (stats["runs"] + 2))
+
+
+def estimate_durations(items, history):
+    known = [history[item.nodeid]["seconds"] for item in items if item.nodeid in history]
+    default = statistics.median(known) if known else DEFAULT_SECONDS
+    return {item.nodeid: history[item.nodeid]["seconds"] if item.nodeid in history else default for item in items}
+
+
+def smart_order(items, history, durations):
+    """Orders the groups by failure probability per second, highest first.
+
+    This is Smith's rule for the shortest expected time to the first failure. Groups (serial
+    tests and their data dependencies) move as a whole and keep their inner order; ties keep
+    collection order.
+    """
+    def priority(group):
+        passing = 1.0
+        for item in group:
+            passing *= 1 - failure_probability(history.get(item.nodeid))
+        seconds = sum(durations[item.nodeid] for item in group)
+        return (1 - passing) / max(seconds, 1e-3)
+
+    groups = group_items(items)
+    return [item for group in sorted(groups, key=priority, reverse=True) for item in group]
+
+
+class Scheduler:
+    """Keeps per-test duration and outcome history in the pytest cache and orders runs by it."""
+
+    def __init__(self, config):
+        self.config = config
+        self.history = config.cache.get(CACHE_KEY, {})
+        self.results = {}
+        self.known_tests = 0
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        durations = estimate_durations(items, self.history)
+        config.stash[estimated_durations_key] = durations
+        self.known_tests = sum(1 for item in items if item.nodeid in self.history)
+        if config.getoption("--schedule") == "smart":
+            items[:] = smart_order(items, self.history, durations)
+
+    def pytest_report_collectionfinish(self, config, items):
+        if config.getoption("--schedule") == "smart":
+            return f"schedule: smart, history for {self.known_tests}/{len(items)} test(s)"
+        return None
+
+    def pytest_runtest_logreport(self, report):
+        result = self.results.setdefault(report.nodeid, {"seconds": 0.0, "failed": False, "ran": False})
+        result["seconds"] += report.duration
+        result["failed"] = result["failed"] or report.failed
+        if report.when == "call" and not report.skipped:
+            result["ran"] = True
+
+    def pytest_sessionfinish(self, session):
+        ran = {nodeid: result for nodeid, result in self.results.items() if result["ran"] or result["failed"]}
+        if not ran:
+            return
+        for nodeid, result in ran.items():
+            self.history[nodeid] = update_stats(self.history.get(nodeid), result["seconds"], result["failed"])
+        self.config.cache.set(CACHE_KEY, self.history)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        flaky = sorted(
+            ((nodeid, flakiness(stats)) for nodeid, stats in self.history.items()
+             if nodeid in self.results and stats["runs"] >= 5 and flakiness(stats) >= 0.2),
+            key=lambda entry: -entry[1]
+        )
+        if not flaky:
+            return
+        terminalreporter.section("flaky tests")
+        for nodeid, rate in flaky[:10]:
+            terminalreporter.write_line(f"{nodeid}: outcome changed in {rate * 100:.0f}% of runs")
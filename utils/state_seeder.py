@@ -0,0 +1,57 @@
+import requests
+
+from pages.base_page import BasePage
+
+# nopCommerce shopping cart types
+SHOPPING_CART = 1
+WISHLIST = 2
+
+
+class StateSeeder:
+    """Builds cart and wishlist preconditions with plain HTTP calls that share the browser's cookies.
+
+    Only the behaviour under test has to go through Selenium; everything before it is a few
+    milliseconds of HTTP on the same customer session the browser is using.
+    """
+
+    def __init__(self, driver, base_url=BasePage.base_url):
+        self.driver = driver
+        self.base_url = base_url.rstrip("/")
+
+    def add_to_cart(self, product_id, quantity=1):
+        return self._add_product(product_id, SHOPPING_CART, quantity)
+
+    def add_to_wishlist(self, product_id, quantity=1):
+        return self._add_product(product_id, WISHLIST, quantity)
+
+    def _add_product(self, product_id, cart_type, quantity):
+        with self._session() as session:
+            response = session.post(
+                f"{self.base_url}/addproducttocart/catalog/{product_id}/{cart_type}/{quantity}",
+                headers={"X-Requested-With": "XMLHttpRequest"},
+                timeout=10
+            )
+            assert response.ok, f"Seeding product {product_id} failed with status {response.status_code}"
+            body = response.json()
+            assert body.get("success"), f"Seeding product {product_id} was rejected: {body.get('message')}"
+            self._copy_cookies_to_browser(session)
+        return body
+
+    # HTTP session carrying the browser's cookies and user agent
+    def _session(self):
+        if not self.driver.current_url.startswith(self.base_url):
+            # Cookies can only be read and written for the domain currently loaded
+            self.driver.get(self.base_url + "/")
+
+        session = requests.Session()
+        session.headers["User-Agent"] = self.driver.execute_script("return navigator.userAgent;")
+        for cookie in self.driver.get_cookies():
+            session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+        return session
+
+    # Keep the browser on the same customer if the server issued new cookies (e.g. a fresh guest)
+    def _copy_cookies_to_browser(self, session):
+        browser_cookies = {cookie["name"]: cookie["value"] for cookie in self.driver.get_cookies()}
+        for cookie in session.cookies:
+            if browser_cookies.get(cookie.name) != cookie.value:
+                self.driver.add_cookie({"name": cookie.name, "value": cookie.value, "path": cookie.path or "/"})
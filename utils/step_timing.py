@@ -0,0 +1,135 @@
+import contextlib
+import functools
+import time
+
+from selenium.webdriver.remote.command import Command
+
+# WebDriver commands whose time is reported as navigation time
+NAVIGATION_COMMANDS = {Command.GET, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH}
+
+# Commands that may navigate; their time counts as navigation when a new document replaced the old one
+MAY_NAVIGATE_COMMANDS = {Command.CLICK_ELEMENT}
+
+# Identifies the current document: a new page load gets a new time origin
+_document_script = "return performance.timeOrigin;"
+
+# Recorder of the test currently running in this process, if timing is enabled
+_active = None
+
+
+class StepRecorder:
+    """Builds the timing tree of one test: every page-object step with its wait, command and navigation cost."""
+
+    def __init__(self):
+        self.commands = 0
+        self.wait_seconds = 0.0
+        self.navigation_seconds = 0.0
+        self.root = {"name": "test", "children": []}
+        self._stack = [self.root]
+        self._driver = None
+        self._document = None  # Time origin of the current document, None when unknown
+
+    # Count (and time navigation) WebDriver commands sent through this driver
+    def attach(self, driver):
+        original_execute = driver.execute
+
+        def document():
+            # Not counted as a command of the step: it only exists because timing is enabled
+            try:
+                return original_execute(Command.W3C_EXECUTE_SCRIPT, {"script": _document_script, "args": []})["value"]
+            except Exception:
+                return None
+
+        def execute(driver_command, params=None):
+            self.commands += 1
+            if driver_command in MAY_NAVIGATE_COMMANDS:
+                # WebDriver waits for a page load the click starts (per the page load strategy) before it returns
+                before = self._document if self._document is not None else document()
+                start = time.perf_counter()
+                try:
+                    return original_execute(driver_command, params)
+                finally:
+                    seconds = time.perf_counter() - start
+                    self._document = document()
+                    if before is not None and self._document is not None and self._document != before:
+                        self.navigation_seconds += seconds
+            if driver_command not in NAVIGATION_COMMANDS:
+                return original_execute(driver_command, params)
+            self._document = None
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                self.navigation_seconds += time.perf_counter() - start
+
+        driver.execute = execute
+        self._driver = driver
+
+    def detach(self):
+        if self._driver is not None:
+            del self._driver.execute  # Drop the instance override, back to WebDriver.execute
+            self._driver = None
+
+    @contextlib.contextmanager
+    def step(self, name):
+        node = {"name": name, "children": []}
+        self._stack[-1]["children"].append(node)
+        self._stack.append(node)
+        start = time.perf_counter()
+        commands, wait_seconds, navigation_seconds = self.commands, self.wait_seconds, self.navigation_seconds
+        node["failed"] = True
+        try:
+            yield node
+            node["failed"] = False
+        finally:
+            self._stack.pop()
+            node["seconds"] = time.perf_counter() - start
+            node["waitSeconds"] = self.wait_seconds - wait_seconds
+            node["commands"] = self.commands - commands
+            node["navigationSeconds"] = self.navigation_seconds - navigation_seconds
+
+    def tree(self):
+        return {
+            "steps": self.root["children"],
+            "commands": self.commands,
+            "waitSeconds": self.wait_seconds,
+            "navigationSeconds": self.navigation_seconds,
+        }
+
+
+def start_recording(driver):
+    global _active
+    _active = StepRecorder()
+    _active.attach(driver)
+    return _active
+
+
+def stop_recording():
+    global _active
+    recorder, _active = _active, None
+    if recorder is None:
+        return None
+    recorder.detach()
+    return recorder.tree()
+
+
+def record_wait(seconds):
+    """Called by the wait engine for every finished wait."""
+    if _active is not None:
+        _active.wait_seconds += seconds
+
+
+def timed_step(function, name=None):
+    """Wraps a page-object method so it shows up as a step when timing is enabled."""
+    name = name or function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        recorder = _active
+        if recorder is None:
+            return function(*args, **kwargs)
+        with recorder.step(name):
+            return function(*args, **kwargs)
+
+    wrapper.timed_step = True
+    return wrapper
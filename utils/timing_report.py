@@ -0,0 +1,83 @@
+import html
+import json
+import os
+
+from utils.parallel import is_worker
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--timing-report", action="store", default=None, metavar="DIR",
+        help="Time every page-object step and write timing.json and timing.html to DIR"
+    )
+
+
+def pytest_configure(config):
+    report_dir = config.getoption("--timing-report")
+    if report_dir:
+        config.pluginmanager.register(TimingReport(report_dir), "webshop-timing-report")
+
+
+class TimingReport:
+    """Collects the per-test timing trees from the test reports and writes them at session end."""
+
+    def __init__(self, report_dir):
+        self.report_dir = report_dir
+        self.results = {}
+
+    def pytest_runtest_logreport(self, report):
+        entry = self.results.setdefault(report.nodeid, {"nodeid": report.nodeid, "outcome": "passed", "seconds": 0.0})
+        entry["seconds"] += report.duration
+        if report.failed:
+            entry["outcome"] = "failed"
+        elif report.skipped and entry["outcome"] == "passed":
+            entry["outcome"] = "skipped"
+        if report.when == "teardown":
+            for name, tree in report.user_properties:
+                if name == "timing":
+                    entry.update(tree)
+
+    def pytest_sessionfinish(self, session):
+        if is_worker():
+            return  # Workers forward their reports; the main process writes the files
+        results = list(self.results.values())
+        os.makedirs(self.report_dir, exist_ok=True)
+        with open(os.path.join(self.report_dir, "timing.json"), "w") as file:
+            json.dump({"tests": results}, file, indent=2)
+        with open(os.path.join(self.report_dir, "timing.html"), "w") as file:
+            file.write(render_html(results))
+
+
+def render_html(results):
+    rows = []
+
+    def add_rows(steps, depth):
+        for step in steps:
+            rows.append(
+                f"<tr class=\"{'failed' if step.get('failed') else ''}\">"
+                f"<td style=\"padding-left:{1 + depth * 1.5}em\">{html.escape(step['name'])}</td>"
+                f"<td>{step['seconds']:.3f}</td><td>{step['waitSeconds']:.3f}</td>"
+                f"<td>{step['navigationSeconds']:.3f}</td><td>{step['commands']}</td></tr>"
+            )
+            add_rows(step["children"], depth + 1)
+
+    for result in sorted(results, key=lambda result: result["seconds"], reverse=True):
+        rows.append(
+            f"<tr class=\"test {result['outcome']}\"><th>{html.escape(result['nodeid'])}</th>"
+            f"<th>{result['seconds']:.3f}</th><th>{result.get('waitSeconds', 0):.3f}</th>"
+            f"<th>{result.get('navigationSeconds', 0):.3f}</th><th>{result.get('commands', 0)}</th></tr>"
+        )
+        add_rows(result.get("steps", []), 1)
+
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Step timing</title><style>"
+        "body{font-family:sans-serif}table{border-collapse:collapse}td,th{padding:2px 8px;text-align:left}"
+        "tr.test{background:#eee}tr.failed{color:#b00}td+td,th+th{text-align:right}"
+        "</style></head><body><h1>Step timing</h1>"
+        "<p>Navigation time covers get, back, forward and refresh, and clicks that loaded a new document, up to "
+        "where the page load strategy lets the command return; loading after that point shows up as wait time.</p>"
+        "<table>"
+        "<tr><th>test / step</th><th>total s</th><th>wait s</th><th>navigation s</th><th>commands</th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
@@ -0,0 +1,103 @@
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+
+from utils import step_timing
+
+WaitRecord = namedtuple("WaitRecord", "description seconds polls succeeded")
+
+
+class Waiter:
+    """Explicit wait with adaptive polling.
+
+    Conditions are polled quickly at first and the interval backs off up to ``max_poll``,
+    so a ready element is picked up within a few milliseconds instead of up to half a second.
+    Every wait is recorded with its real duration.
+    """
+
+    ignored_exceptions = (NoSuchElementException, StaleElementReferenceException)
+
+    def __init__(self, driver, timeout=10, initial_poll=0.05, max_poll=0.5, backoff=1.5):
+        self.driver = driver
+        self.timeout = timeout
+        self.initial_poll = initial_poll
+        self.max_poll = max_poll
+        self.backoff = backoff
+        self.records = []
+
+    @property
+    def total_seconds(self):
+        return sum(record.seconds for record in self.records)
+
+    # Wait until the condition returns a truthy value and return it
+    def until(self, condition, timeout=None, message="", description=None):
+        return self._poll(condition, True, timeout, message, description)
+
+    # Wait until the condition returns a falsy value
+    def until_not(self, condition, timeout=None, message="", description=None):
+        return self._poll(condition, False, timeout, message, description)
+
+    # Shortcuts for the conditions the page objects use
+    def visible(self, locator, timeout=None):
+        return self.until(EC.visibility_of_element_located(locator), timeout, description=f"visible {locator}")
+
+    def clickable(self, locator, timeout=None):
+        return self.until(EC.element_to_be_clickable(locator), timeout, description=f"clickable {locator}")
+
+    def present(self, locator, timeout=None):
+        return self.until(EC.presence_of_element_located(locator), timeout, description=f"present {locator}")
+
+    def all_present(self, locator, timeout=None):
+        return self.until(EC.presence_of_all_elements_located(locator), timeout, description=f"all present {locator}")
+
+    def invisible(self, locator, timeout=None):
+        return self.until(EC.invisibility_of_element_located(locator), timeout, description=f"invisible {locator}")
+
+    # Wait for several elements to be visible at the same time and return them in order
+    def all_visible(self, *locators, timeout=None):
+        conditions = [EC.visibility_of_element_located(locator) for locator in locators]
+
+        def all_conditions(driver):
+            elements = []
+            for condition in conditions:
+                element = condition(driver)
+                if not element:
+                    return False
+                elements.append(element)
+            return elements
+
+        return self.until(all_conditions, timeout, description=f"all visible {list(locators)}")
+
+    def _record(self, description, start, polls, succeeded):
+        seconds = time.perf_counter() - start
+        self.records.append(WaitRecord(description, seconds, polls, succeeded))
+        step_timing.record_wait(seconds)
+
+    def _poll(self, condition, expected, timeout, message, description):
+        timeout = self.timeout if timeout is None else timeout
+        description = description or getattr(condition, "__name__", repr(condition))
+        start = time.perf_counter()
+        deadline = start + timeout
+        interval = self.initial_poll
+        polls = 0
+        while True:
+            polls += 1
+            try:
+                value = condition(self.driver)
+                if bool(value) == expected:
+                    self._record(description, start, polls, True)
+                    return value if expected else True
+            except self.ignored_exceptions:
+                if not expected:
+                    # A vanished element satisfies a negative wait
+                    self._record(description, start, polls, True)
+                    return True
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                self._record(description, start, polls, False)
+                raise TimeoutException(message or f"Timed out after {timeout}s waiting for {description}")
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_poll)
@@ -0,0 +1,94 @@
+import json
+
+# Collector of the test currently running in this process, if page metrics are enabled
+_active = None
+
+# Metrics of the current document once it has finished loading, or null while it is still loading.
+# LCP and layout shifts are only exposed to performance observers; a buffered observer hands
+# over the entries recorded so far through takeRecords() without waiting for a callback.
+_metrics_script = """
+    var navigation = performance.getEntriesByType('navigation')[0];
+    if (!navigation || !navigation.loadEventEnd) {
+        return null;
+    }
+    function records(type) {
+        try {
+            var observer = new PerformanceObserver(function () {});
+            observer.observe({type: type, buffered: true});
+            var entries = observer.takeRecords();
+            observer.disconnect();
+            return entries;
+        } catch (error) {
+            return null;  // Entry type not supported by this browser
+        }
+    }
+    var paint = performance.getEntriesByName('first-contentful-paint')[0];
+    var lcp = records('largest-contentful-paint');
+    var shifts = records('layout-shift');
+    return {
+        url: location.href,
+        ttfb: navigation.responseStart - navigation.startTime,
+        domContentLoaded: navigation.domContentLoadedEventEnd - navigation.startTime,
+        load: navigation.loadEventEnd - navigation.startTime,
+        fcp: paint ? paint.startTime : null,
+        lcp: lcp && lcp.length ? lcp[lcp.length - 1].startTime : null,
+        cls: shifts ? shifts.filter(function (shift) { return !shift.hadRecentInput; })
+            .reduce(function (total, shift) { return total + shift.value; }, 0) : null
+    };
+"""
+
+
+def load_budgets(path="test_data.json"):
+    with open(path) as file:
+        return json.load(file)["demoWebShopData"].get("performanceBudgets", {})
+
+
+class WebVitalsCollector:
+    """Page-load metrics of one test, checked against per-page budgets (ms, CLS unitless)."""
+
+    def __init__(self, budgets):
+        self.budgets = budgets
+        self.measurements = []
+        self.violations = []
+
+    def budget(self, page):
+        return {**self.budgets.get("default", {}), **self.budgets.get(page, {})}
+
+    def capture(self, driver, page, waiter, url_contains=None):
+        if url_contains:
+            # Navigation started by a click: let the browser leave the previous document first
+            waiter.until(lambda driver: url_contains in driver.current_url, description=f"url contains {url_contains}")
+        metrics = waiter.until(
+            lambda driver: driver.execute_script(_metrics_script), description=f"page metrics of '{page}'"
+        )
+        metrics["page"] = page
+        self.measurements.append(metrics)
+        for name, limit in self.budget(page).items():
+            value = metrics.get(name)
+            if value is not None and value > limit:
+                self.violations.append(f"{page}: {name} {value:.3g} over budget {limit} ({metrics['url']})")
+        return metrics
+
+
+def start_collecting(budgets):
+    global _active
+    _active = WebVitalsCollector(budgets)
+    return _active
+
+
+def stop_collecting():
+    global _active
+    collector, _active = _active, None
+    return collector
+
+
+def violations():
+    """Budget violations of the running test so far."""
+    return list(_active.violations) if _active is not None else []
+
+
+def capture(driver, page, waiter, url_contains=None):
+    """Called by the page objects after every navigation; a no-op unless collection is enabled."""
+    if _active is None:
+        return None
+    return _active.capture(driver, page, waiter, url_contains)